@@ -0,0 +1,526 @@
+"""Scale benchmarks for the scanner, the poller and RCON against fake servers.
+
+Run from the repository root in an environment with Home Assistant and
+mcstatus installed::
+
+    python -m benchmarks.bench --servers 200 --output before.json
+    # ... change something ...
+    python -m benchmarks.bench --servers 200 --output after.json --compare before.json
+
+Every benchmark reports wall time and event-loop lag, the memory
+benchmark reports the bytes allocated per polled server and the RCON
+benchmark checks that multi-packet responses arrive complete. Results are
+written as JSON together with the commit they were measured on.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from importlib import metadata
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from .fake_rcon import FakeRconServer, FakeRconSpec, forge_tps_output
+from .fake_server import FakeServerFarm, FakeServerSpec
+
+HOST = "127.0.0.1"
+# Below the usual ephemeral range (Linux 32768-60999), so client sockets of
+# one benchmark cannot occupy ports the next farm binds
+DEFAULT_BASE_PORT = 20000
+DEFAULT_SCAN_RANGES = (10, 100, 1000)
+LAG_INTERVAL = 0.005  # seconds
+TRACE_FRAMES = 25
+HARNESS_DIR = str(Path(__file__).parent)
+INTEGRATION_DIR = str(Path(__file__).parent.parent / "custom_components" / "mc_server_stats")
+
+
+class LoopLagMonitor:
+    """Measures how late a periodic timer fires, i.e. how long the loop was blocked."""
+
+    def __init__(self, interval: float = LAG_INTERVAL) -> None:
+        """Initialize the monitor."""
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected))
+
+    def __enter__(self) -> LoopLagMonitor:
+        """Start sampling."""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+
+    def summary(self) -> dict[str, float]:
+        """Return max and p99 lag in milliseconds."""
+        if not self.samples:
+            return {"loop_lag_max_ms": 0.0, "loop_lag_p99_ms": 0.0}
+        ordered = sorted(self.samples)
+        return {
+            "loop_lag_max_ms": round(ordered[-1] * 1000, 3),
+            "loop_lag_p99_ms": round(
+                ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 3
+            ),
+        }
+
+
+async def _timed(func: Callable[[], Awaitable[Any]]) -> tuple[Any, dict[str, float]]:
+    """Await a call while measuring wall time and loop lag."""
+    with LoopLagMonitor() as monitor:
+        started = time.perf_counter()
+        result = await func()
+        elapsed = time.perf_counter() - started
+    return result, {"wall_s": round(elapsed, 4), **monitor.summary()}
+
+
+def _spec(args: argparse.Namespace, index: int) -> FakeServerSpec:
+    """Return the spec of the n-th fake server."""
+    players = [f"Player{n}" for n in range(args.players)]
+    return FakeServerSpec(
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        drop_rate=args.drop_rate,
+        players_online=len(players),
+        player_sample=players,
+        forge_mods=[(f"mod{n}", "1.0.0") for n in range(args.mods)],
+        motd=f"Benchmark server {index}",
+    )
+
+
+async def bench_scan(args: argparse.Namespace, size: int) -> dict[str, Any]:
+    """Scan a port range of the given size with the servers spread across it."""
+    from custom_components.mc_server_stats.coordinator import async_scan_ports
+
+    count = min(args.servers, size)
+    stride = size // count
+    specs = {
+        args.base_port + index * stride: _spec(args, index) for index in range(count)
+    }
+    port_max = args.base_port + size - 1
+
+    async with FakeServerFarm(specs, HOST) as farm:
+        found, metrics = await _timed(
+            lambda: async_scan_ports(HOST, args.base_port, port_max, args.timeout)
+        )
+    return {
+        "ports": size,
+        "servers": count,
+        "found": len(found),
+        "connections": farm.requests,
+        **metrics,
+    }
+
+
+async def _make_coordinators(hass: Any, ports: list[int], interval: int) -> list[Any]:
+    from custom_components.mc_server_stats.coordinator import McServerStatsCoordinator
+
+    return [McServerStatsCoordinator(hass, HOST, port, interval) for port in ports]
+
+
+async def bench_poll(args: argparse.Namespace, hass: Any) -> dict[str, Any]:
+    """Refresh all servers concurrently for a number of rounds."""
+    specs = {args.base_port + index: _spec(args, index) for index in range(args.servers)}
+
+    async with FakeServerFarm(specs, HOST) as farm:
+        coordinators = await _make_coordinators(hass, farm.ports, 60)
+        rounds: list[float] = []
+        online = 0
+
+        async def _poll() -> None:
+            nonlocal online
+            for _ in range(args.rounds):
+                started = time.perf_counter()
+                await asyncio.gather(*(c.async_refresh() for c in coordinators))
+                rounds.append(time.perf_counter() - started)
+            online = sum(1 for c in coordinators if c.data and c.data.online)
+
+        _, metrics = await _timed(_poll)
+
+    polls = len(coordinators) * args.rounds
+    return {
+        "servers": len(coordinators),
+        "rounds": args.rounds,
+        "online": online,
+        "polls_per_s": round(polls / metrics["wall_s"], 1),
+        "round_median_s": round(statistics.median(rounds), 4),
+        **metrics,
+    }
+
+
+def _held(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot) -> int:
+    """Return the bytes allocated between two snapshots and still alive."""
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+async def bench_memory(args: argparse.Namespace, hass: Any) -> dict[str, Any]:
+    """Measure the memory held per server after one poll.
+
+    The fake servers are polled once before measuring, so their cached
+    responses exist already, and every allocation with a fake server frame
+    on the stack is excluded. ``bytes_integration`` only counts allocations made
+    with the integration or mcstatus on the stack.
+    """
+    import mcstatus
+
+    from custom_components.mc_server_stats.coordinator import async_probe_ports
+
+    specs = {args.base_port + index: _spec(args, index) for index in range(args.servers)}
+    harness = tracemalloc.Filter(False, f"{HARNESS_DIR}/fake_*", all_frames=True)
+    own = [
+        tracemalloc.Filter(True, f"{INTEGRATION_DIR}/*", all_frames=True),
+        tracemalloc.Filter(True, f"{Path(mcstatus.__file__).parent}/*", all_frames=True),
+        harness,
+    ]
+
+    async with FakeServerFarm(specs, HOST) as farm:
+        await async_probe_ports(HOST, farm.ports, args.timeout)
+        gc.collect()
+        tracemalloc.start(TRACE_FRAMES)
+        before = tracemalloc.take_snapshot()
+        coordinators = await _make_coordinators(hass, farm.ports, 60)
+        await asyncio.gather(*(c.async_refresh() for c in coordinators))
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    held = _held(before.filter_traces([harness]), after.filter_traces([harness]))
+    held_own = _held(before.filter_traces(own), after.filter_traces(own))
+    count = max(1, len(coordinators))
+    return {
+        "servers": len(coordinators),
+        "online": sum(1 for c in coordinators if c.data and c.data.online),
+        "bytes_total": held,
+        "bytes_per_server": held // count,
+        "bytes_integration": held_own,
+        "bytes_integration_per_server": held_own // count,
+    }
+
+
+async def _async_add_host_entry(hass: Any, ports: list[int], profile: str) -> Any:
+    """Register a host entry with one server subentry per port, without setting it up."""
+    from homeassistant.config_entries import ConfigEntry, ConfigSubentryData
+
+    from custom_components.mc_server_stats.const import (
+        CONF_ENTITY_PROFILE,
+        CONF_HOST,
+        CONF_PORT,
+        CONF_SERVER_NAME,
+        DOMAIN,
+        SUBENTRY_TYPE_SERVER,
+    )
+
+    entry = ConfigEntry(
+        domain=DOMAIN,
+        title=HOST,
+        data={CONF_HOST: HOST},
+        options={CONF_ENTITY_PROFILE: profile},
+        source="user",
+        version=2,
+        minor_version=1,
+        unique_id=HOST,
+        discovery_keys={},
+        subentries_data=[
+            ConfigSubentryData(
+                data={CONF_PORT: port, CONF_SERVER_NAME: f"Server {port}"},
+                subentry_type=SUBENTRY_TYPE_SERVER,
+                title=f"Server {port}",
+                unique_id=f"{HOST}:{port}",
+            )
+            for port in ports
+        ],
+    )
+    # Same as the test helpers do, the integration itself is not set up
+    hass.config_entries._entries[entry.entry_id] = entry
+    return entry
+
+
+async def bench_entities(args: argparse.Namespace, profile: str) -> dict[str, Any]:
+    """Set up the entity platforms of all servers and poll with changing players.
+
+    Reports the entities in the state machine, the state events one poll
+    round fires and the memory held per server for one entity profile.
+    Only the sensor, binary sensor and image platforms run, the rest of the
+    integration (HTTP views, discovery) is not set up.
+    """
+    from homeassistant.config_entries import ConfigEntries
+    from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_REPORTED
+    from homeassistant.core import Event, HomeAssistant, callback
+    from homeassistant.helpers import (
+        area_registry,
+        category_registry,
+        device_registry,
+        entity_registry,
+        floor_registry,
+        label_registry,
+    )
+    from homeassistant.helpers.entity_platform import EntityPlatform
+
+    from custom_components.mc_server_stats import binary_sensor, image, sensor
+    from custom_components.mc_server_stats.const import DOMAIN, RCON_KEY
+    from custom_components.mc_server_stats.coordinator import async_probe_ports
+
+    specs = {args.base_port + index: _spec(args, index) for index in range(args.servers)}
+    harness = tracemalloc.Filter(False, f"{HARNESS_DIR}/fake_*", all_frames=True)
+    events = {EVENT_STATE_CHANGED: 0, EVENT_STATE_REPORTED: 0}
+
+    @callback
+    def _count(event: Event) -> None:
+        events[event.event_type] += 1
+
+    @callback
+    def _all(event_data: Any) -> bool:
+        return True
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.config_entries = ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        for registry in (
+            area_registry,
+            category_registry,
+            floor_registry,
+            label_registry,
+            device_registry,
+            entity_registry,
+        ):
+            await registry.async_load(hass)
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _count)
+        hass.bus.async_listen(EVENT_STATE_REPORTED, _count, event_filter=_all)
+
+        async with FakeServerFarm(specs, HOST) as farm:
+            await async_probe_ports(HOST, farm.ports, args.timeout)
+            gc.collect()
+            tracemalloc.start(TRACE_FRAMES)
+            before = tracemalloc.take_snapshot()
+
+            entry = await _async_add_host_entry(hass, farm.ports, profile)
+            coordinators = dict(
+                zip(entry.subentries, await _make_coordinators(hass, farm.ports, 60))
+            )
+            hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinators
+            hass.data.setdefault(RCON_KEY, {})[entry.entry_id] = {}
+            for module in (sensor, binary_sensor, image):
+                platform = EntityPlatform(
+                    hass=hass,
+                    logger=logging.getLogger(module.__name__),
+                    domain=module.__name__.rpartition(".")[2],
+                    platform_name=DOMAIN,
+                    platform=None,
+                    scan_interval=timedelta(seconds=60),
+                    entity_namespace=None,
+                )
+                platform.config_entry = entry
+                await module.async_setup_entry(
+                    hass, entry, platform._async_schedule_add_entities_for_entry
+                )
+            await hass.async_block_till_done()
+
+            # First poll fills in every state, the rounds after it are measured
+            await asyncio.gather(*(c.async_refresh() for c in coordinators.values()))
+            events.update(dict.fromkeys(events, 0))
+            for round_index in range(1, args.rounds + 1):
+                for server in farm.servers.values():
+                    server.update(
+                        replace(
+                            server.spec,
+                            players_online=round_index % (server.spec.players_max + 1),
+                        )
+                    )
+                await asyncio.gather(*(c.async_refresh() for c in coordinators.values()))
+            await hass.async_block_till_done()
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            entities = len(hass.states.async_all())
+
+        await hass.async_stop(force=True)
+
+    held = _held(before.filter_traces([harness]), after.filter_traces([harness]))
+    count = max(1, len(coordinators))
+    return {
+        "servers": len(coordinators),
+        "entities": entities,
+        "state_changed_per_round": round(events[EVENT_STATE_CHANGED] / args.rounds, 1),
+        "state_reported_per_round": round(events[EVENT_STATE_REPORTED] / args.rounds, 1),
+        "bytes_total": held,
+        "bytes_per_server": held // count,
+    }
+
+
+async def bench_rcon(args: argparse.Namespace) -> dict[str, Any]:
+    """Run RCON batches whose second response spans several packets."""
+    from custom_components.mc_server_stats.rcon import RconPool, parse_rcon_metrics
+
+    output = forge_tps_output(args.dimensions)
+    spec = FakeRconSpec(
+        responses={
+            "list": "There are 0 of a max of 20 players online: ",
+            "forge tps": output,
+        },
+        latency=args.latency / 1000,
+    )
+    pool = RconPool()
+    complete = 0
+
+    async with FakeRconServer(spec, HOST) as server:
+
+        async def _run() -> None:
+            nonlocal complete
+            for _ in range(args.rounds):
+                responses = await pool.async_run_batch(
+                    HOST, server.port, spec.password, ["list", "forge tps"]
+                )
+                if responses[1] == output and parse_rcon_metrics(responses).tps == 20.0:
+                    complete += 1
+
+        _, metrics = await _timed(_run)
+        await pool.async_release(HOST, server.port)
+
+    return {
+        "response_bytes": len(output.encode("utf-8")),
+        "batches": args.rounds,
+        "complete": complete,
+        "batches_per_s": round(args.rounds / metrics["wall_s"], 1),
+        **metrics,
+    }
+
+
+def _meta(args: argparse.Namespace) -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    versions = {}
+    for package in ("homeassistant", "mcstatus"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        **versions,
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "args": vars(args) | {"output": None, "compare": None},
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the selected benchmarks and return the results."""
+    from homeassistant.core import HomeAssistant
+
+    results: dict[str, Any] = {}
+    if "scan" in args.only:
+        for size in args.scan_ranges:
+            results[f"scan_{size}"] = await bench_scan(args, size)
+            print(f"scan_{size}: {results[f'scan_{size}']}", file=sys.stderr)
+    if "entities" in args.only:
+        for profile in ("full", "lean"):
+            results[f"entities_{profile}"] = await bench_entities(args, profile)
+            print(f"entities_{profile}: {results[f'entities_{profile}']}", file=sys.stderr)
+    if "rcon" in args.only:
+        results["rcon"] = await bench_rcon(args)
+        print(f"rcon: {results['rcon']}", file=sys.stderr)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        if "poll" in args.only:
+            results["poll"] = await bench_poll(args, hass)
+            print(f"poll: {results['poll']}", file=sys.stderr)
+        if "memory" in args.only:
+            results["memory"] = await bench_memory(args, hass)
+            print(f"memory: {results['memory']}", file=sys.stderr)
+
+    return {"meta": _meta(args), "results": results}
+
+
+def compare(old: dict[str, Any], new: dict[str, Any]) -> list[str]:
+    """Return one line per numeric metric present in both result sets."""
+    lines = [
+        f"{'metric':<32} {'before':>12} {'after':>12} {'change':>9}",
+    ]
+    for name, metrics in new["results"].items():
+        previous = old.get("results", {}).get(name, {})
+        for key, value in metrics.items():
+            before = previous.get(key)
+            if not isinstance(value, (int, float)) or not isinstance(before, (int, float)):
+                continue
+            change = f"{(value - before) / before:+.1%}" if before else "n/a"
+            lines.append(f"{name + '.' + key:<32} {before:>12} {value:>12} {change:>9}")
+    return lines
+
+
+def main() -> None:
+    """Parse arguments, run the benchmarks and write or compare the results."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--servers", type=int, default=100, help="number of fake servers")
+    parser.add_argument("--base-port", type=int, default=DEFAULT_BASE_PORT)
+    parser.add_argument(
+        "--scan-ranges",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SCAN_RANGES),
+        help="port range sizes to scan",
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="poll rounds")
+    parser.add_argument("--latency", type=float, default=0.0, help="server latency (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency (ms)")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="share of unanswered connections")
+    parser.add_argument("--players", type=int, default=5, help="players in each sample")
+    parser.add_argument("--mods", type=int, default=0, help="Forge mods per server")
+    parser.add_argument("--timeout", type=float, default=3.0, help="scan timeout (s)")
+    parser.add_argument(
+        "--dimensions", type=int, default=100, help="dimensions in the RCON `forge tps` output"
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=("scan", "poll", "memory", "entities", "rcon"),
+        default=["scan", "poll", "memory", "entities", "rcon"],
+    )
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="compare with earlier results")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    else:
+        print(json.dumps(results, indent=2))
+    if args.compare:
+        print("\n".join(compare(json.loads(args.compare.read_text()), results)))
+
+
+if __name__ == "__main__":
+    main()
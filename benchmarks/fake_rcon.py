@@ -0,0 +1,127 @@
+"""Fake RCON servers behaving like the vanilla Minecraft RCON thread.
+
+Authentication, command responses split into fragments of 4096 characters
+(so a fragment with colour codes is longer than 4096 bytes) and the
+"Unknown request" answer to other packet types are implemented, which is
+what the integration's pipelined batches and their sentinel rely on.
+"""
+from __future__ import annotations
+
+import asyncio
+import struct
+from dataclasses import dataclass, field
+
+PACKET_TYPE_RESPONSE = 0
+PACKET_TYPE_COMMAND = 2
+PACKET_TYPE_LOGIN = 3
+
+MAX_PAYLOAD = 4096  # characters, vanilla splits longer responses by characters
+
+_HEADER = struct.Struct("<iii")
+
+
+def forge_tps_output(dimensions: int, tps: float = 20.0, mspt: float = 1.5) -> str:
+    """Return a `forge tps` style response with the overall line last.
+
+    Values carry § colour codes, two bytes each in UTF-8, so fragments of
+    4096 characters are longer than 4096 bytes.
+    """
+    lines = [
+        f"Dim minecraft:dim{index} (minecraft:dim{index}): "
+        f"Mean tick time: §a{mspt:.3f}§r ms. Mean TPS: §a{tps:.3f}§r"
+        for index in range(dimensions)
+    ]
+    lines.append(f"Overall: Mean tick time: §a{mspt:.3f}§r ms. Mean TPS: §a{tps:.3f}§r")
+    return "\n".join(lines)
+
+
+@dataclass
+class FakeRconSpec:
+    """Behaviour of a single fake RCON server."""
+
+    password: str = "secret"
+    responses: dict[str, str] = field(default_factory=dict)  # command -> output
+    latency: float = 0.0  # seconds added before each command response
+
+
+def _packet(request_id: int, packet_type: int, payload: bytes) -> bytes:
+    body = payload + b"\x00\x00"
+    return _HEADER.pack(len(body) + 8, request_id, packet_type) + body
+
+
+class FakeRconServer:
+    """One fake RCON server listening on a local port."""
+
+    def __init__(self, spec: FakeRconSpec, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Initialize the server."""
+        self.spec = spec
+        self.host = host
+        self.port = port
+        self.commands = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> FakeRconServer:
+        """Start the server."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the server."""
+        await self.stop()
+
+    def _response(self, request_id: int, text: str) -> bytes:
+        chunks = [
+            text[offset : offset + MAX_PAYLOAD]
+            for offset in range(0, len(text), MAX_PAYLOAD)
+        ] or [""]
+        return b"".join(
+            _packet(request_id, PACKET_TYPE_RESPONSE, chunk.encode("utf-8"))
+            for chunk in chunks
+        )
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        authenticated = False
+        try:
+            while True:
+                (length,) = struct.unpack("<i", await reader.readexactly(4))
+                data = await reader.readexactly(length)
+                request_id, packet_type = struct.unpack_from("<ii", data)
+                payload = data[8:-2].decode("utf-8")
+
+                if packet_type == PACKET_TYPE_LOGIN:
+                    authenticated = payload == self.spec.password
+                    writer.write(
+                        _packet(request_id if authenticated else -1, PACKET_TYPE_COMMAND, b"")
+                    )
+                elif packet_type == PACKET_TYPE_COMMAND:
+                    if not authenticated:
+                        writer.write(_packet(-1, PACKET_TYPE_COMMAND, b""))
+                        continue
+                    self.commands += 1
+                    if self.spec.latency:
+                        await asyncio.sleep(self.spec.latency)
+                    text = self.spec.responses.get(
+                        payload, f"Unknown or incomplete command: {payload}"
+                    )
+                    writer.write(self._response(request_id, text))
+                else:
+                    writer.write(
+                        self._response(request_id, f"Unknown request {packet_type:x}")
+                    )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,203 @@
+"""Fake Minecraft Java servers speaking the Server List Ping protocol.
+
+Only the status handshake is implemented: handshake, status request and
+ping. Each server can add latency, drop connections, report Forge mods and
+a player sample, which is enough to drive the integration's scanner and
+poller against hundreds of servers on localhost.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import struct
+from dataclasses import dataclass, field
+from typing import Any
+
+DEFAULT_PROTOCOL = 767  # 1.21
+
+
+@dataclass
+class FakeServerSpec:
+    """Behaviour of a single fake server."""
+
+    latency: float = 0.0  # seconds added before each response
+    jitter: float = 0.0  # random extra latency, uniform in [0, jitter]
+    drop_rate: float = 0.0  # share of connections that are never answered
+    players_online: int = 0
+    players_max: int = 20
+    player_sample: list[str] = field(default_factory=list)
+    forge_mods: list[tuple[str, str]] = field(default_factory=list)
+    motd: str = "A Minecraft Server"
+    version: str = "1.21"
+    favicon: str | None = None  # data URL, as sent by real servers
+
+    def status(self) -> dict[str, Any]:
+        """Return the status response JSON."""
+        status: dict[str, Any] = {
+            "version": {"name": self.version, "protocol": DEFAULT_PROTOCOL},
+            "players": {
+                "online": self.players_online,
+                "max": self.players_max,
+                "sample": [
+                    {"name": name, "id": f"00000000-0000-0000-0000-{index:012d}"}
+                    for index, name in enumerate(self.player_sample)
+                ],
+            },
+            "description": {"text": self.motd},
+        }
+        if self.forge_mods:
+            status["forgeData"] = {
+                "fmlNetworkVersion": 3,
+                "channels": [],
+                "mods": [
+                    {"modId": mod_id, "modmarker": version}
+                    for mod_id, version in self.forge_mods
+                ],
+            }
+        if self.favicon:
+            status["favicon"] = self.favicon
+        return status
+
+
+def _encode_varint(value: int) -> bytes:
+    value &= 0xFFFFFFFF
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+async def _read_varint(reader: asyncio.StreamReader) -> int:
+    result = 0
+    for shift in range(0, 35, 7):
+        byte = (await reader.readexactly(1))[0]
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result
+    raise ValueError("VarInt too long")
+
+
+def _packet(packet_id: int, payload: bytes) -> bytes:
+    body = _encode_varint(packet_id) + payload
+    return _encode_varint(len(body)) + body
+
+
+class FakeMinecraftServer:
+    """One fake server listening on a local port."""
+
+    def __init__(self, spec: FakeServerSpec, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Initialize the server."""
+        self.spec = spec
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self.dropped = 0
+        self._server: asyncio.Server | None = None
+        self._response: bytes | None = None
+        self._random = random.Random(port)
+
+    def update(self, spec: FakeServerSpec) -> None:
+        """Change the behaviour, e.g. let players join between polls."""
+        self.spec = spec
+        self._response = None
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening and close open connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _delay(self) -> None:
+        delay = self.spec.latency + self._random.uniform(0, self.spec.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _status_packet(self) -> bytes:
+        if self._response is None:
+            payload = json.dumps(self.spec.status()).encode("utf-8")
+            self._response = _packet(0x00, _encode_varint(len(payload)) + payload)
+        return self._response
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.requests += 1
+        try:
+            if self._random.random() < self.spec.drop_rate:
+                # Accept but never answer, like a lost packet the client times out on
+                self.dropped += 1
+                await reader.read()
+                return
+
+            while True:
+                length = await _read_varint(reader)
+                data = await reader.readexactly(length)
+                packet_id = data[0]
+                if packet_id == 0x00 and length > 1:
+                    continue  # handshake
+                await self._delay()
+                if packet_id == 0x00:
+                    writer.write(self._status_packet())
+                elif packet_id == 0x01:
+                    (token,) = struct.unpack(">q", data[1:9])
+                    writer.write(_packet(0x01, struct.pack(">q", token)))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+class FakeServerFarm:
+    """Many fake servers on consecutive ports, usable as an async context manager.
+
+    Ports in the range that are not in ``specs`` stay closed, so scans see
+    the same mix of open and refused ports as on a real host.
+    """
+
+    def __init__(
+        self,
+        specs: dict[int, FakeServerSpec],
+        host: str = "127.0.0.1",
+    ) -> None:
+        """Initialize the farm with a spec per port."""
+        self.host = host
+        self.servers = {
+            port: FakeMinecraftServer(spec, host, port) for port, spec in specs.items()
+        }
+
+    @classmethod
+    def uniform(
+        cls, base_port: int, count: int, spec: FakeServerSpec, host: str = "127.0.0.1"
+    ) -> FakeServerFarm:
+        """Return a farm of identical servers on base_port .. base_port + count - 1."""
+        return cls({base_port + offset: spec for offset in range(count)}, host)
+
+    @property
+    def ports(self) -> list[int]:
+        """Return the ports with a server, ascending."""
+        return sorted(self.servers)
+
+    async def __aenter__(self) -> FakeServerFarm:
+        """Start all servers."""
+        await asyncio.gather(*(server.start() for server in self.servers.values()))
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop all servers."""
+        await asyncio.gather(*(server.stop() for server in self.servers.values()))
+
+    @property
+    def requests(self) -> int:
+        """Return the number of connections accepted by all servers."""
+        return sum(server.requests for server in self.servers.values())
@@ -1,41 +1,68 @@
 """The Minecraft Server Stats integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
-from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
-from homeassistant.components.http import StaticPathConfig
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigSubentry
 from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.event import async_call_later
 
+from .card import CARD_JS, CardAsset, McServerCardView, load_card_asset
 from .const import (
     CONF_DISCOVERY_INTERVAL,
+    CONF_DISCOVERY_SHARDS,
+    CONF_ENTITY_PROFILE,
     CONF_HOST,
+    CONF_MERGED_INTO,
     CONF_PORT,
     CONF_PORT_MAX,
     CONF_PORT_MIN,
+    CONF_RCON_COMMANDS,
+    CONF_RCON_PASSWORD,
+    CONF_RCON_PORT,
     CONF_SCAN_INTERVAL,
+    CONF_SERVER_NAME,
+    CONF_SERVERS,
     DEFAULT_DISCOVERY_INTERVAL,
+    DEFAULT_DISCOVERY_SHARDS,
+    DEFAULT_ENTITY_PROFILE,
+    DEFAULT_RCON_COMMANDS,
+    DEFAULT_RCON_PORT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     PLATFORMS,
+    RCON_KEY,
+    RCON_POOL_KEY,
     SCAN_PORT_MAX,
     SCAN_PORT_MIN,
+    SUBENTRY_TYPE_SERVER,
 )
-from .coordinator import McDiscoveryCoordinator, McServerStatsCoordinator
+from .coordinator import (
+    McDiscoveryCoordinator,
+    McRconCoordinator,
+    McServerStatsCoordinator,
+)
+from .favicon import McServerFaviconView
+from .index import async_get_index
+from .portmap import PortMapStore
+from .push import McServerPushView
+from .rcon import RconPool
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 DISCOVERY_KEY = f"{DOMAIN}_discovery"
+PORT_MAP_KEY = f"{DOMAIN}_port_map"
+SETTINGS_KEY = f"{DOMAIN}_settings"
+UPDATE_LOCKS_KEY = f"{DOMAIN}_update_locks"
+CARD_KEY = f"{DOMAIN}_card"
 CARD_REGISTERED_KEY = f"{DOMAIN}_card_registered"
 
-CARD_STATIC_PATH = f"/hacsfiles/{DOMAIN}"
-CARD_JS = "mc-server-stats-card.js"
-CARD_URL = f"{CARD_STATIC_PATH}/{CARD_JS}"
-CARD_DIR = Path(__file__).parent / "www"
-
 RESOURCE_STARTUP_DELAY = 5
 RESOURCE_RETRY_DELAY = 30
 RESOURCE_MAX_RETRIES = 3
@@ -43,15 +70,13 @@ RESOURCE_RETRY_KEY = f"{DOMAIN}_card_register_retries"
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
-    """Serve the custom card JS file via HTTP."""
-    # Serve the www/ folder under /hacsfiles/mc_server_stats/
-    await hass.http.async_register_static_paths(
-        [
-            StaticPathConfig(
-                CARD_STATIC_PATH, str(CARD_DIR), cache_headers=False
-            ),
-        ]
-    )
+    """Serve the card, the push endpoint and favicons, and register services."""
+    # Serve the card from memory under /hacsfiles/mc_server_stats/
+    card = hass.data[CARD_KEY] = await hass.async_add_executor_job(load_card_asset)
+    hass.http.register_view(McServerCardView(card))
+    hass.http.register_view(McServerPushView())
+    hass.http.register_view(McServerFaviconView())
+    async_setup_services(hass)
     hass.async_create_task(_async_register_lovelace_resource(hass))
     return True
 
@@ -60,6 +85,7 @@ async def _async_register_lovelace_resource(hass: HomeAssistant) -> None:
     """Add the card JS as a Lovelace dashboard resource so it appears in the card picker."""
     if hass.data.get(CARD_REGISTERED_KEY):
         return
+    card: CardAsset = hass.data[CARD_KEY]
 
     def _schedule_retry(delay: int, *, increment: bool = True) -> None:
         if hass.data.get(CARD_REGISTERED_KEY):
@@ -70,7 +96,7 @@ async def _async_register_lovelace_resource(hass: HomeAssistant) -> None:
                 _LOGGER.warning(
                     "Could not auto-register Lovelace resource. "
                     "Please add '%s' manually under Settings → Dashboards → Resources (type: JavaScript Module).",
-                    CARD_URL,
+                    card.url,
                 )
                 return
             hass.data[RESOURCE_RETRY_KEY] = retries + 1
@@ -95,72 +121,249 @@ async def _async_register_lovelace_resource(hass: HomeAssistant) -> None:
         elif hasattr(resources, "async_get_info"):
             await resources.async_get_info()
 
-        # Check if already registered (and clean up stale entries)
+        # Check if already registered (and update entries of older versions)
         items = []
         if hasattr(resources, "async_items"):
             items = list(resources.async_items())
         elif hasattr(resources, "data"):
             items = list(resources.data.values()) if isinstance(resources.data, dict) else list(resources.data)
 
+        registered = False
         for item in items:
             url = item.get("url", "") if isinstance(item, dict) else getattr(item, "url", "")
             item_id = item.get("id", "") if isinstance(item, dict) else getattr(item, "id", "")
-            if url == CARD_URL:
-                hass.data[CARD_REGISTERED_KEY] = True
-                hass.data.pop(RESOURCE_RETRY_KEY, None)
-                _LOGGER.debug("Lovelace resource already registered: %s", url)
-                return
-            if CARD_JS in url and url != CARD_URL:
+            if CARD_JS not in url:
+                continue
+            if registered:
+                # Duplicate of the entry already pointing at the card
                 try:
                     await resources.async_delete_item(item_id)
-                    _LOGGER.info("Removed stale card resource: %s", url)
+                    _LOGGER.info("Removed duplicate card resource: %s", url)
                 except Exception:  # noqa: BLE001
                     pass
-
-        # Create the resource
-        await resources.async_create_item({"res_type": "module", "url": CARD_URL})
+                continue
+            registered = True
+            if url == card.url:
+                _LOGGER.debug("Lovelace resource already registered: %s", url)
+                continue
+            # Unversioned or older version – point it at the current card
+            await resources.async_update_item(
+                item_id, {"res_type": "module", "url": card.url}
+            )
+            _LOGGER.info("Updated card resource: %s -> %s", url, card.url)
+
+        if not registered:
+            await resources.async_create_item({"res_type": "module", "url": card.url})
+            _LOGGER.info("Auto-registered Lovelace resource: %s", card.url)
         hass.data[CARD_REGISTERED_KEY] = True
         hass.data.pop(RESOURCE_RETRY_KEY, None)
-        _LOGGER.info("Auto-registered Lovelace resource: %s", CARD_URL)
 
     except Exception as exc:  # noqa: BLE001
         _LOGGER.debug("Lovelace resource registration attempt failed: %s", exc)
         _schedule_retry(RESOURCE_RETRY_DELAY)
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Minecraft Server Stats from a config entry."""
+# Options that can be applied to the running coordinators; anything else
+# (added, removed or edited servers, the entity profile) needs a reload.
+LIVE_OPTIONS = {
+    CONF_SCAN_INTERVAL,
+    CONF_DISCOVERY_INTERVAL,
+    CONF_DISCOVERY_SHARDS,
+    CONF_PORT_MIN,
+    CONF_PORT_MAX,
+}
+
+# Settings that belong to a single server (subentry) rather than to the host
+SERVER_KEYS = (
+    CONF_PORT,
+    CONF_SERVER_NAME,
+    CONF_RCON_PORT,
+    CONF_RCON_PASSWORD,
+    CONF_RCON_COMMANDS,
+)
+
+
+def _entry_settings(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the effective settings of a host entry (options override data)."""
+    defaults = {
+        CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+        CONF_DISCOVERY_INTERVAL: DEFAULT_DISCOVERY_INTERVAL,
+        CONF_DISCOVERY_SHARDS: DEFAULT_DISCOVERY_SHARDS,
+        CONF_PORT_MIN: SCAN_PORT_MIN,
+        CONF_PORT_MAX: SCAN_PORT_MAX,
+        CONF_ENTITY_PROFILE: DEFAULT_ENTITY_PROFILE,
+    }
+    settings: dict[str, Any] = {
+        key: entry.options.get(key, entry.data.get(key, default))
+        for key, default in defaults.items()
+    }
+    settings[CONF_SERVERS] = {
+        subentry_id: dict(subentry.data)
+        for subentry_id, subentry in entry.subentries.items()
+        if subentry.subentry_type == SUBENTRY_TYPE_SERVER
+    }
+    return settings
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate per-server entries (version 1) to one entry per host.
+
+    The first version 1 entry of a host becomes the host entry and every
+    version 1 entry of that host, including itself, becomes a server
+    subentry. Entities and devices are moved along, the other entries are
+    marked as merged and removed during their setup.
+    """
+    if entry.version > 2:
+        return False
+    if entry.version == 2:
+        return True
+
     host = entry.data[CONF_HOST]
-    port = entry.data[CONF_PORT]
-    scan_interval = entry.options.get(
-        CONF_SCAN_INTERVAL,
-        entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-    )
-    discovery_interval = entry.options.get(
-        CONF_DISCOVERY_INTERVAL,
-        entry.data.get(CONF_DISCOVERY_INTERVAL, DEFAULT_DISCOVERY_INTERVAL),
-    )
-    port_min = entry.options.get(
-        CONF_PORT_MIN,
-        entry.data.get(CONF_PORT_MIN, SCAN_PORT_MIN),
+    entries = hass.config_entries.async_entries(DOMAIN)
+    server_entries = [
+        e for e in entries if e.version == 1 and e.data.get(CONF_HOST) == host
+    ]
+    host_entry = next(
+        (
+            e
+            for e in entries
+            if e.version >= 2 and e.unique_id == host and CONF_MERGED_INTO not in e.data
+        ),
+        None,
     )
-    port_max = entry.options.get(
-        CONF_PORT_MAX,
-        entry.data.get(CONF_PORT_MAX, SCAN_PORT_MAX),
+
+    # Collect the server settings before the host entry's options are replaced
+    subentries: list[tuple[ConfigEntry, ConfigSubentry]] = []
+    for server_entry in server_entries:
+        merged = {**server_entry.data, **server_entry.options}
+        subentries.append(
+            (
+                server_entry,
+                ConfigSubentry(
+                    data=MappingProxyType(
+                        {key: merged[key] for key in SERVER_KEYS if key in merged}
+                    ),
+                    subentry_type=SUBENTRY_TYPE_SERVER,
+                    title=server_entry.title,
+                    unique_id=f"{host}:{server_entry.data[CONF_PORT]}",
+                ),
+            )
+        )
+
+    if host_entry is None:
+        host_entry = entry
+        hass.config_entries.async_update_entry(
+            entry,
+            title=host,
+            unique_id=host,
+            data={
+                key: value
+                for key, value in entry.data.items()
+                if key not in SERVER_KEYS
+            },
+            options={
+                key: value
+                for key, value in entry.options.items()
+                if key not in SERVER_KEYS
+            },
+            version=2,
+        )
+
+    ent_reg = er.async_get(hass)
+    dev_reg = dr.async_get(hass)
+    for server_entry, subentry in subentries:
+        hass.config_entries.async_add_subentry(host_entry, subentry)
+
+        for entity in er.async_entries_for_config_entry(ent_reg, server_entry.entry_id):
+            ent_reg.async_update_entity(
+                entity.entity_id,
+                config_entry_id=host_entry.entry_id,
+                config_subentry_id=subentry.subentry_id,
+            )
+        for device in dr.async_entries_for_config_entry(dev_reg, server_entry.entry_id):
+            dev_reg.async_update_device(
+                device.id,
+                add_config_entry_id=host_entry.entry_id,
+                add_config_subentry_id=subentry.subentry_id,
+                remove_config_entry_id=server_entry.entry_id,
+                remove_config_subentry_id=None,
+            )
+
+        if server_entry is not host_entry:
+            hass.config_entries.async_update_entry(
+                server_entry,
+                data={**server_entry.data, CONF_MERGED_INTO: host_entry.entry_id},
+                version=2,
+            )
+
+    _LOGGER.info(
+        "Migrated %d server(s) on %s into a single host entry", len(subentries), host
     )
+    return True
 
-    coordinator = McServerStatsCoordinator(hass, host, port, scan_interval)
-    await coordinator.async_config_entry_first_refresh()
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up all Minecraft servers of a host from its config entry."""
+    if CONF_MERGED_INTO in entry.data:
+        # Leftover of the migration to host entries, its servers moved over
+        hass.async_create_task(hass.config_entries.async_remove(entry.entry_id))
+        return True
+
+    host = entry.data[CONF_HOST]
+    settings = _entry_settings(entry)
+    scan_interval = settings[CONF_SCAN_INTERVAL]
+
+    coordinators: dict[str, McServerStatsCoordinator] = {}
+    rcon_coordinators: dict[str, McRconCoordinator] = {}
+    for subentry_id, server in settings[CONF_SERVERS].items():
+        coordinator = McServerStatsCoordinator(
+            hass, host, server[CONF_PORT], scan_interval
+        )
+        entry.async_on_unload(coordinator.health.async_register(coordinator))
+        coordinators[subentry_id] = coordinator
+
+        # Optional RCON collector for performance metrics (TPS, MSPT, chunks)
+        if rcon_password := server.get(CONF_RCON_PASSWORD):
+            rcon_commands = server.get(CONF_RCON_COMMANDS, DEFAULT_RCON_COMMANDS)
+            pool: RconPool = hass.data.setdefault(RCON_POOL_KEY, RconPool())
+            rcon_coordinators[subentry_id] = McRconCoordinator(
+                hass,
+                pool,
+                host,
+                server.get(CONF_RCON_PORT, DEFAULT_RCON_PORT),
+                rcon_password,
+                [cmd.strip() for cmd in rcon_commands.split(",") if cmd.strip()],
+                scan_interval,
+            )
+
+    # Refresh all servers of the host together instead of one after another
+    await asyncio.gather(
+        *(
+            coordinator.async_config_entry_first_refresh()
+            for coordinator in (*coordinators.values(), *rcon_coordinators.values())
+        )
+    )
 
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data[DOMAIN][entry.entry_id] = coordinators
+    hass.data.setdefault(RCON_KEY, {})
+    hass.data[RCON_KEY][entry.entry_id] = rcon_coordinators
+    hass.data.setdefault(SETTINGS_KEY, {})
+    hass.data[SETTINGS_KEY][entry.entry_id] = settings
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
-    # Start the background discovery scanner for this host (shared across entries)
-    await _async_start_discovery(hass, host, discovery_interval, port_min, port_max)
+    # Start the background discovery scanner for this host
+    await _async_start_discovery(
+        hass,
+        host,
+        settings[CONF_DISCOVERY_INTERVAL],
+        settings[CONF_PORT_MIN],
+        settings[CONF_PORT_MAX],
+        settings[CONF_DISCOVERY_SHARDS],
+    )
 
     return True
 
@@ -171,6 +374,7 @@ async def _async_start_discovery(
     discovery_interval: int,
     port_min: int,
     port_max: int,
+    shards: int = DEFAULT_DISCOVERY_SHARDS,
 ) -> None:
     """Start a background discovery coordinator for a host (if not already running)."""
     hass.data.setdefault(DISCOVERY_KEY, {})
@@ -178,13 +382,21 @@ async def _async_start_discovery(
     if host in hass.data[DISCOVERY_KEY]:
         # Update the existing discovery coordinator with new settings
         existing: McDiscoveryCoordinator = hass.data[DISCOVERY_KEY][host]
-        existing.port_min = port_min
-        existing.port_max = port_max
-        existing.update_interval = timedelta(seconds=discovery_interval)
+        existing.async_configure(discovery_interval, port_min, port_max, shards)
         return
 
+    if PORT_MAP_KEY not in hass.data:
+        port_map = hass.data[PORT_MAP_KEY] = PortMapStore(hass)
+        await port_map.async_load()
+
     discovery = McDiscoveryCoordinator(
-        hass, host, discovery_interval, port_min, port_max
+        hass,
+        host,
+        discovery_interval,
+        port_min,
+        port_max,
+        shards,
+        hass.data[PORT_MAP_KEY],
     )
 
     @callback
@@ -193,36 +405,15 @@ async def _async_start_discovery(
         if discovery.data is None:
             return
 
-        # Collect all ports that already have a config entry for this host
-        configured_ports: set[int] = set()
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            if entry.data.get(CONF_HOST) == host:
-                configured_ports.add(entry.data.get(CONF_PORT, 0))
-
-        # Also check pending flows to avoid duplicates
-        pending_ports: set[int] = set()
-        for flow in hass.config_entries.flow.async_progress_by_handler(DOMAIN):
-            ctx = flow.get("context", {})
-            if ctx.get("source") == "discovery":
-                placeholders = ctx.get("title_placeholders", {})
-                if placeholders.get("host") == host:
-                    try:
-                        pending_ports.add(int(placeholders.get("port", 0)))
-                    except (ValueError, TypeError):
-                        pass
-
-        for port in discovery.data:
-            if port not in configured_ports and port not in pending_ports:
-                _LOGGER.info(
-                    "Discovered new Minecraft server on %s:%s", host, port
-                )
-                hass.async_create_task(
-                    hass.config_entries.flow.async_init(
-                        DOMAIN,
-                        context={"source": "discovery"},
-                        data={CONF_HOST: host, CONF_PORT: port},
-                    )
+        for port in async_get_index(hass).unknown_ports(host, discovery.data):
+            _LOGGER.info("Discovered new Minecraft server on %s:%s", host, port)
+            hass.async_create_task(
+                hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": "discovery"},
+                    data={CONF_HOST: host, CONF_PORT: port},
                 )
+            )
 
     discovery.async_add_listener(_on_discovery_update)
     await discovery.async_config_entry_first_refresh()
@@ -230,30 +421,81 @@ async def _async_start_discovery(
 
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update – reload the integration."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Handle options and server updates – apply live where possible, reload otherwise.
+
+    Adding several servers at once fires one update per server. Updates are
+    handled one at a time and compared against what is applied after the
+    previous one finished, so they cause a single reload.
+    """
+    locks: dict[str, asyncio.Lock] = hass.data.setdefault(UPDATE_LOCKS_KEY, {})
+    async with locks.setdefault(entry.entry_id, asyncio.Lock()):
+        await _async_apply_update(hass, entry)
+
+
+async def _async_apply_update(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply the current settings of an entry."""
+    applied: dict[str, Any] | None = hass.data.get(SETTINGS_KEY, {}).get(
+        entry.entry_id
+    )
+    settings = _entry_settings(entry)
+    changed = {key for key in settings if applied is None or settings[key] != applied[key]}
+
+    if not changed:
+        return
+    if applied is None or not changed <= LIVE_OPTIONS:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    _LOGGER.debug("Applying options of %s live: %s", entry.title, sorted(changed))
+    hass.data[SETTINGS_KEY][entry.entry_id] = settings
+
+    if CONF_SCAN_INTERVAL in changed:
+        scan_interval = settings[CONF_SCAN_INTERVAL]
+        for coordinator in hass.data[DOMAIN][entry.entry_id].values():
+            coordinator.async_set_poll_interval(scan_interval)
+        for rcon_coordinator in hass.data[RCON_KEY][entry.entry_id].values():
+            rcon_coordinator.update_interval = timedelta(seconds=scan_interval)
+
+    if changed & {CONF_DISCOVERY_INTERVAL, CONF_DISCOVERY_SHARDS, CONF_PORT_MIN, CONF_PORT_MAX}:
+        await _async_start_discovery(
+            hass,
+            entry.data[CONF_HOST],
+            settings[CONF_DISCOVERY_INTERVAL],
+            settings[CONF_PORT_MIN],
+            settings[CONF_PORT_MAX],
+            settings[CONF_DISCOVERY_SHARDS],
+        )
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if CONF_MERGED_INTO in entry.data:
+        return True
+
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        hass.data.get(SETTINGS_KEY, {}).pop(entry.entry_id, None)
 
         host = entry.data[CONF_HOST]
 
-        # Check if there are remaining entries for this host
-        remaining = [
-            e
-            for e in hass.config_entries.async_entries(DOMAIN)
-            if e.data.get(CONF_HOST) == host and e.entry_id != entry.entry_id
-        ]
-        if not remaining and host in hass.data.get(DISCOVERY_KEY, {}):
-            hass.data[DISCOVERY_KEY].pop(host, None)
+        rcon_coordinators: dict[str, McRconCoordinator] = hass.data.get(
+            RCON_KEY, {}
+        ).pop(entry.entry_id, {})
+        for rcon_coordinator in rcon_coordinators.values():
+            await rcon_coordinator.async_release()
+
+        if host in hass.data.get(DISCOVERY_KEY, {}):
+            discovery: McDiscoveryCoordinator = hass.data[DISCOVERY_KEY].pop(host)
+            await discovery.async_shutdown()
 
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN, None)
 
     return unload_ok
 
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop what is kept for a removed entry."""
+    hass.data.get(UPDATE_LOCKS_KEY, {}).pop(entry.entry_id, None)
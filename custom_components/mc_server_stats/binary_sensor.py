@@ -11,7 +11,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_HOST, CONF_PORT, CONF_SERVER_NAME, DOMAIN
+from .const import CONF_HOST, CONF_SERVER_NAME, DOMAIN
 from .coordinator import McServerData, McServerStatsCoordinator
 
 
@@ -20,16 +20,17 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up Minecraft Server Stats binary sensor entities."""
-    coordinator: McServerStatsCoordinator = hass.data[DOMAIN][entry.entry_id]
+    """Set up Minecraft Server Stats binary sensor entities for all servers of a host."""
+    coordinators: dict[str, McServerStatsCoordinator] = hass.data[DOMAIN][entry.entry_id]
     host = entry.data[CONF_HOST]
-    port = entry.data[CONF_PORT]
-    custom_name = entry.data.get(CONF_SERVER_NAME)
 
-    async_add_entities(
-        [McServerOnlineBinarySensor(coordinator, host, port, custom_name)],
-        update_before_add=True,
-    )
+    for subentry_id, coordinator in coordinators.items():
+        custom_name = entry.subentries[subentry_id].data.get(CONF_SERVER_NAME)
+        async_add_entities(
+            [McServerOnlineBinarySensor(coordinator, host, coordinator.port, custom_name)],
+            update_before_add=True,
+            config_subentry_id=subentry_id,
+        )
 
 
 class McServerOnlineBinarySensor(
@@ -0,0 +1,110 @@
+"""Content-hashed, precompressed delivery of the dashboard card."""
+from __future__ import annotations
+
+import gzip
+import hashlib
+from dataclasses import dataclass
+from http import HTTPStatus
+from pathlib import Path
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+
+from .const import DOMAIN
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+CARD_STATIC_PATH = f"/hacsfiles/{DOMAIN}"
+CARD_JS = "mc-server-stats-card.js"
+CARD_URL = f"{CARD_STATIC_PATH}/{CARD_JS}"
+CARD_FILE = Path(__file__).parent / "www" / CARD_JS
+
+CONTENT_TYPE = "application/javascript"
+CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_REVALIDATE = "no-cache"
+
+
+@dataclass(frozen=True)
+class CardAsset:
+    """The card JS with its content hash and precompressed variants."""
+
+    hash: str
+    body: bytes
+    encoded: dict[str, bytes]
+
+    @property
+    def url(self) -> str:
+        """Return the versioned URL of the card."""
+        return f"{CARD_URL}?v={self.hash}"
+
+
+def load_card_asset(path: Path = CARD_FILE) -> CardAsset:
+    """Read, hash and compress the card (blocking, run in the executor)."""
+    body = path.read_bytes()
+    encoded = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoded["br"] = brotli.compress(body, mode=brotli.MODE_TEXT)
+    return CardAsset(
+        hash=hashlib.sha256(body).hexdigest()[:12],
+        body=body,
+        encoded=encoded,
+    )
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """Return the content codings of an Accept-Encoding header (q=0 excluded)."""
+    accepted: set[str] = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.replace(" ", "").lower() in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class McServerCardView(HomeAssistantView):
+    """Serve the card from memory.
+
+    Requests for the current version (``?v=<hash>``) are cacheable forever,
+    since a new card gets a new URL. Unversioned requests must revalidate
+    and get a 304 while the card is unchanged.
+    """
+
+    url = CARD_URL
+    name = f"{DOMAIN}:card"
+    requires_auth = False
+
+    def __init__(self, asset: CardAsset) -> None:
+        """Initialize the view."""
+        self._asset = asset
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the card, compressed if the client supports it."""
+        asset = self._asset
+        etag = f'"{asset.hash}"'
+        headers = {
+            hdrs.ETAG: etag,
+            hdrs.VARY: hdrs.ACCEPT_ENCODING,
+            hdrs.CACHE_CONTROL: (
+                CACHE_IMMUTABLE
+                if request.query.get("v") == asset.hash
+                else CACHE_REVALIDATE
+            ),
+        }
+        if etag in request.headers.get(hdrs.IF_NONE_MATCH, ""):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        body = asset.body
+        accepted = _accepted_encodings(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+        for coding in ("br", "gzip"):
+            if coding in accepted and coding in asset.encoded:
+                body = asset.encoded[coding]
+                headers[hdrs.CONTENT_ENCODING] = coding
+                break
+
+        return web.Response(body=body, content_type=CONTENT_TYPE, headers=headers)
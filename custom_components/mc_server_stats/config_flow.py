@@ -2,29 +2,57 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigSubentry,
+    ConfigSubentryData,
+    ConfigSubentryFlow,
+    OptionsFlow,
+    SubentryFlowResult,
+)
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
 from .const import (
     CONF_DISCOVERY_INTERVAL,
+    CONF_DISCOVERY_SHARDS,
+    CONF_ENTITY_PROFILE,
     CONF_HOST,
     CONF_PORT,
     CONF_PORT_MAX,
     CONF_PORT_MIN,
+    CONF_RCON_COMMANDS,
+    CONF_RCON_PASSWORD,
+    CONF_RCON_PORT,
     CONF_SCAN_INTERVAL,
     CONF_SERVER_NAME,
     DEFAULT_DISCOVERY_INTERVAL,
+    DEFAULT_DISCOVERY_SHARDS,
+    DEFAULT_ENTITY_PROFILE,
+    DEFAULT_PORT,
+    DEFAULT_RCON_COMMANDS,
+    DEFAULT_RCON_PORT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    ENTITY_PROFILE_FULL,
+    ENTITY_PROFILE_LEAN,
     SCAN_PORT_MAX,
     SCAN_PORT_MIN,
+    SUBENTRY_TYPE_SERVER,
 )
 from .coordinator import async_scan_ports
+from .index import async_get_index
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,7 +78,7 @@ USER_DATA_SCHEMA = vol.Schema(
 class McServerStatsConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Minecraft Server Stats."""
 
-    VERSION = 1
+    VERSION = 2
 
     def __init__(self) -> None:
         """Initialize the config flow."""
@@ -64,6 +92,16 @@ class McServerStatsConfigFlow(ConfigFlow, domain=DOMAIN):
         self._disc_host: str = ""
         self._disc_port: int = 0
 
+    def _host_data(self, host: str) -> dict[str, Any]:
+        """Return the data of a new host entry."""
+        return {
+            CONF_HOST: host,
+            CONF_SCAN_INTERVAL: self._scan_interval,
+            CONF_DISCOVERY_INTERVAL: self._discovery_interval,
+            CONF_PORT_MIN: self._port_min,
+            CONF_PORT_MAX: self._port_max,
+        }
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -84,12 +122,16 @@ class McServerStatsConfigFlow(ConfigFlow, domain=DOMAIN):
             if self._port_min > self._port_max:
                 errors["base"] = "invalid_port_range"
             else:
-                self._ports = await async_scan_ports(
+                found = await async_scan_ports(
                     self._host, self._port_min, self._port_max
                 )
+                configured = async_get_index(self.hass).configured_ports(self._host)
+                self._ports = [port for port in found if port not in configured]
 
-                if not self._ports:
+                if not found:
                     errors["base"] = "cannot_connect"
+                elif not self._ports:
+                    return self.async_abort(reason="already_configured")
                 else:
                     return await self.async_step_select_servers()
 
@@ -106,56 +148,16 @@ class McServerStatsConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            entries_created = 0
-
+            servers: list[ConfigSubentryData] = []
             for port in self._ports:
-                name_key = f"name_{port}"
-                if name_key in user_input:
-                    name = user_input[name_key].strip()
-                    if name:
-                        unique_id = f"{self._host}:{port}"
-                        existing = await self.async_set_unique_id(unique_id)
-                        if existing:
-                            self.context.pop("unique_id", None)
-                            continue
-
-                        entry_data = {
-                            CONF_HOST: self._host,
-                            CONF_PORT: port,
-                            CONF_SCAN_INTERVAL: self._scan_interval,
-                            CONF_DISCOVERY_INTERVAL: self._discovery_interval,
-                            CONF_PORT_MIN: self._port_min,
-                            CONF_PORT_MAX: self._port_max,
-                            CONF_SERVER_NAME: name,
-                        }
-
-                        if entries_created == 0:
-                            entries_created += 1
-                            self._first_entry = {
-                                "title": name,
-                                "data": entry_data,
-                            }
-                        else:
-                            entries_created += 1
-                            self.hass.async_create_task(
-                                self.hass.config_entries.flow.async_init(
-                                    DOMAIN,
-                                    context={"source": "internal"},
-                                    data=entry_data,
-                                )
-                            )
-
-            if entries_created == 0:
+                name = user_input.get(f"name_{port}", "").strip()
+                if name:
+                    servers.append(_server_subentry_data(self._host, port, name))
+
+            if not servers:
                 errors["base"] = "no_servers_selected"
             else:
-                await self.async_set_unique_id(
-                    f"{self._first_entry['data'][CONF_HOST]}:{self._first_entry['data'][CONF_PORT]}"
-                )
-                self._abort_if_unique_id_configured()
-                return self.async_create_entry(
-                    title=self._first_entry["title"],
-                    data=self._first_entry["data"],
-                )
+                return await self._async_add_servers(self._host, servers)
 
         schema_dict: dict[vol.Marker, Any] = {}
         for port in self._ports:
@@ -176,17 +178,36 @@ class McServerStatsConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
-    async def async_step_internal(
-        self, discovery_info: dict[str, Any]
+    async def _async_add_servers(
+        self, host: str, servers: list[ConfigSubentryData]
     ) -> FlowResult:
-        """Handle creation of additional server entries from the select_servers step."""
-        unique_id = f"{discovery_info[CONF_HOST]}:{discovery_info[CONF_PORT]}"
-        await self.async_set_unique_id(unique_id)
-        self._abort_if_unique_id_configured()
+        """Add servers to the entry of their host, creating it if needed."""
+        host_entry = self.hass.config_entries.async_entry_for_domain_unique_id(
+            DOMAIN, host
+        )
+        if host_entry is None:
+            # Host entries are keyed by host; discovery flows carry "host:port"
+            # until here so ignoring a discovery only ignores that server
+            await self.async_set_unique_id(host, raise_on_progress=False)
+            return self.async_create_entry(
+                title=host,
+                data=self._host_data(host),
+                subentries=servers,
+            )
 
-        return self.async_create_entry(
-            title=discovery_info[CONF_SERVER_NAME],
-            data=discovery_info,
+        for server in servers:
+            self.hass.config_entries.async_add_subentry(
+                host_entry,
+                ConfigSubentry(
+                    data=MappingProxyType(server["data"]),
+                    subentry_type=server["subentry_type"],
+                    title=server["title"],
+                    unique_id=server["unique_id"],
+                ),
+            )
+        return self.async_abort(
+            reason="servers_added",
+            description_placeholders={"count": str(len(servers)), "host": host},
         )
 
     async def async_step_discovery(
@@ -199,11 +220,18 @@ class McServerStatsConfigFlow(ConfigFlow, domain=DOMAIN):
         unique_id = f"{self._disc_host}:{self._disc_port}"
         await self.async_set_unique_id(unique_id)
         self._abort_if_unique_id_configured()
+        if self._disc_port in async_get_index(self.hass).configured_ports(
+            self._disc_host
+        ):
+            return self.async_abort(reason="already_configured")
 
         self.context["title_placeholders"] = {
             "host": self._disc_host,
             "port": str(self._disc_port),
         }
+        async_get_index(self.hass).async_add_pending(
+            self._disc_host, self._disc_port, self.flow_id
+        )
 
         return await self.async_step_discovery_confirm()
 
@@ -213,34 +241,9 @@ class McServerStatsConfigFlow(ConfigFlow, domain=DOMAIN):
         """Let the user name the discovered server and confirm setup."""
         if user_input is not None:
             name = user_input[CONF_SERVER_NAME].strip()
-            # Inherit settings from an existing entry on this host
-            scan_interval = DEFAULT_SCAN_INTERVAL
-            discovery_interval = DEFAULT_DISCOVERY_INTERVAL
-            port_min = SCAN_PORT_MIN
-            port_max = SCAN_PORT_MAX
-            for entry in self.hass.config_entries.async_entries(DOMAIN):
-                if entry.data.get(CONF_HOST) == self._disc_host:
-                    scan_interval = entry.data.get(
-                        CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-                    )
-                    discovery_interval = entry.data.get(
-                        CONF_DISCOVERY_INTERVAL, DEFAULT_DISCOVERY_INTERVAL
-                    )
-                    port_min = entry.data.get(CONF_PORT_MIN, SCAN_PORT_MIN)
-                    port_max = entry.data.get(CONF_PORT_MAX, SCAN_PORT_MAX)
-                    break
-
-            return self.async_create_entry(
-                title=name,
-                data={
-                    CONF_HOST: self._disc_host,
-                    CONF_PORT: self._disc_port,
-                    CONF_SCAN_INTERVAL: scan_interval,
-                    CONF_DISCOVERY_INTERVAL: discovery_interval,
-                    CONF_PORT_MIN: port_min,
-                    CONF_PORT_MAX: port_max,
-                    CONF_SERVER_NAME: name,
-                },
+            return await self._async_add_servers(
+                self._disc_host,
+                [_server_subentry_data(self._disc_host, self._disc_port, name)],
             )
 
         return self.async_show_form(
@@ -259,12 +262,123 @@ class McServerStatsConfigFlow(ConfigFlow, domain=DOMAIN):
             },
         )
 
+    @callback
+    def async_remove(self) -> None:
+        """Drop a finished or aborted discovery flow from the server index."""
+        if self._disc_host:
+            async_get_index(self.hass).async_remove_pending(
+                self._disc_host, self._disc_port, self.flow_id
+            )
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
         """Get the options flow for this handler."""
         return McServerStatsOptionsFlow()
 
+    @classmethod
+    @callback
+    def async_get_supported_subentry_types(
+        cls, config_entry: ConfigEntry
+    ) -> dict[str, type[ConfigSubentryFlow]]:
+        """Return the subentry types supported by this handler."""
+        return {SUBENTRY_TYPE_SERVER: McServerSubentryFlow}
+
+
+def _server_subentry_data(host: str, port: int, name: str) -> ConfigSubentryData:
+    """Return the subentry data for a server on a host."""
+    return ConfigSubentryData(
+        data={CONF_PORT: port, CONF_SERVER_NAME: name},
+        subentry_type=SUBENTRY_TYPE_SERVER,
+        title=name,
+        unique_id=f"{host}:{port}",
+    )
+
+
+def _server_schema(defaults: dict[str, Any], *, with_port: bool) -> vol.Schema:
+    """Return the form schema for adding or editing a server."""
+    schema: dict[vol.Marker, Any] = {}
+    if with_port:
+        schema[
+            vol.Required(CONF_PORT, default=defaults.get(CONF_PORT, DEFAULT_PORT))
+        ] = vol.All(vol.Coerce(int), vol.Range(min=1, max=65535))
+    schema.update(
+        {
+            vol.Required(
+                CONF_SERVER_NAME, default=defaults.get(CONF_SERVER_NAME, "")
+            ): str,
+            vol.Optional(
+                CONF_RCON_PORT, default=defaults.get(CONF_RCON_PORT, DEFAULT_RCON_PORT)
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
+            vol.Optional(
+                CONF_RCON_PASSWORD, default=defaults.get(CONF_RCON_PASSWORD, "")
+            ): str,
+            vol.Optional(
+                CONF_RCON_COMMANDS,
+                default=defaults.get(CONF_RCON_COMMANDS, DEFAULT_RCON_COMMANDS),
+            ): str,
+        }
+    )
+    return vol.Schema(schema)
+
+
+class McServerSubentryFlow(ConfigSubentryFlow):
+    """Handle adding or editing a single server of a host."""
+
+    async def async_step_user(
+        self, user_input: dict[str, Any] | None = None
+    ) -> SubentryFlowResult:
+        """Add a server to the host by port."""
+        host = self._get_entry().data[CONF_HOST]
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            port = user_input[CONF_PORT]
+            if port in async_get_index(self.hass).configured_ports(host):
+                return self.async_abort(reason="already_configured")
+            if not await async_scan_ports(host, port, port):
+                errors["base"] = "cannot_connect"
+            else:
+                name = user_input[CONF_SERVER_NAME].strip() or (
+                    f"Minecraft Server ({host}:{port})"
+                )
+                return self.async_create_entry(
+                    title=name,
+                    data={**user_input, CONF_SERVER_NAME: name},
+                    unique_id=f"{host}:{port}",
+                )
+
+        return self.async_show_form(
+            step_id="user",
+            data_schema=_server_schema(user_input or {}, with_port=True),
+            description_placeholders={"host": host},
+            errors=errors,
+        )
+
+    async def async_step_reconfigure(
+        self, user_input: dict[str, Any] | None = None
+    ) -> SubentryFlowResult:
+        """Rename a server or change its RCON settings."""
+        subentry = self._get_reconfigure_subentry()
+
+        if user_input is not None:
+            name = user_input[CONF_SERVER_NAME].strip() or subentry.title
+            return self.async_update_and_abort(
+                self._get_entry(),
+                subentry,
+                title=name,
+                data={**subentry.data, **user_input, CONF_SERVER_NAME: name},
+            )
+
+        return self.async_show_form(
+            step_id="reconfigure",
+            data_schema=_server_schema(dict(subentry.data), with_port=False),
+            description_placeholders={
+                "host": self._get_entry().data[CONF_HOST],
+                "port": str(subentry.data[CONF_PORT]),
+            },
+        )
+
 
 class McServerStatsOptionsFlow(OptionsFlow):
     """Handle options flow for Minecraft Server Stats."""
@@ -298,6 +412,10 @@ class McServerStatsOptionsFlow(OptionsFlow):
             CONF_DISCOVERY_INTERVAL,
             self.config_entry.data.get(CONF_DISCOVERY_INTERVAL, DEFAULT_DISCOVERY_INTERVAL),
         )
+        current_discovery_shards = self.config_entry.options.get(
+            CONF_DISCOVERY_SHARDS,
+            self.config_entry.data.get(CONF_DISCOVERY_SHARDS, DEFAULT_DISCOVERY_SHARDS),
+        )
         current_port_min = self.config_entry.options.get(
             CONF_PORT_MIN,
             self.config_entry.data.get(CONF_PORT_MIN, SCAN_PORT_MIN),
@@ -306,6 +424,10 @@ class McServerStatsOptionsFlow(OptionsFlow):
             CONF_PORT_MAX,
             self.config_entry.data.get(CONF_PORT_MAX, SCAN_PORT_MAX),
         )
+        current_entity_profile = self.config_entry.options.get(
+            CONF_ENTITY_PROFILE,
+            self.config_entry.data.get(CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE),
+        )
 
         return self.async_show_form(
             step_id="init",
@@ -317,12 +439,24 @@ class McServerStatsOptionsFlow(OptionsFlow):
                     vol.Optional(
                         CONF_DISCOVERY_INTERVAL, default=current_discovery
                     ): vol.All(vol.Coerce(int), vol.Range(min=30, max=86400)),
+                    vol.Optional(
+                        CONF_DISCOVERY_SHARDS, default=current_discovery_shards
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
                     vol.Optional(
                         CONF_PORT_MIN, default=current_port_min
                     ): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
                     vol.Optional(
                         CONF_PORT_MAX, default=current_port_max
                     ): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
+                    vol.Optional(
+                        CONF_ENTITY_PROFILE, default=current_entity_profile
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=[ENTITY_PROFILE_FULL, ENTITY_PROFILE_LEAN],
+                            mode=SelectSelectorMode.LIST,
+                            translation_key=CONF_ENTITY_PROFILE,
+                        )
+                    ),
                 }
             ),
             errors=errors,
@@ -5,16 +5,55 @@ DOMAIN = "mc_server_stats"
 DEFAULT_PORT = 25565
 DEFAULT_SCAN_INTERVAL = 60  # seconds
 DEFAULT_DISCOVERY_INTERVAL = 300  # seconds (5 min)
+DEFAULT_DISCOVERY_SHARDS = 1
+MIN_DISCOVERY_TICK = 10  # seconds
+DEFAULT_PUSH_LIVENESS_INTERVAL = 300  # seconds (5 min)
 SCAN_PORT_MIN = 25565
 SCAN_PORT_MAX = 25575
+# Adaptive timeouts: a multiple of the observed p99 RTT, clamped to these bounds
+TIMEOUT_FLOOR = 0.5  # seconds
+POLL_TIMEOUT_CEILING = 5.0  # seconds
+SCAN_TIMEOUT_CEILING = 3.0  # seconds
+TIMEOUT_RTT_MULTIPLIER = 4
+# Head start of the preferred address family when racing IPv6 and IPv4 (RFC 8305)
+HAPPY_EYEBALLS_DELAY = 0.25  # seconds
+DEFAULT_RCON_PORT = 25575
+DEFAULT_RCON_COMMANDS = "tps, mspt"
+ENTITY_PROFILE_FULL = "full"
+ENTITY_PROFILE_LEAN = "lean"
+DEFAULT_ENTITY_PROFILE = ENTITY_PROFILE_FULL
 
 CONF_HOST = "host"
 CONF_PORT = "port"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_DISCOVERY_INTERVAL = "discovery_interval"
+CONF_DISCOVERY_SHARDS = "discovery_shards"
+CONF_ENTITY_PROFILE = "entity_profile"
 CONF_PORT_MIN = "port_min"
 CONF_PORT_MAX = "port_max"
 CONF_SERVER_NAME = "server_name"
+CONF_RCON_PORT = "rcon_port"
+CONF_RCON_PASSWORD = "rcon_password"
+CONF_RCON_COMMANDS = "rcon_commands"
+CONF_SERVERS = "servers"
+CONF_MERGED_INTO = "merged_into"
 
-PLATFORMS = ["sensor", "binary_sensor"]
+SUBENTRY_TYPE_SERVER = "server"
+
+SERVICE_PROFILE = "profile"
+SERVICE_GET_STATUS = "get_status"
+ATTR_DURATION = "duration"
+ATTR_ONLINE_ONLY = "online_only"
+ATTR_REFRESH = "refresh"
+DEFAULT_PROFILE_DURATION = 60  # seconds
+MAX_PROFILE_DURATION = 600  # seconds
+MAX_PARALLEL_REFRESHES = 20
+
+RCON_KEY = f"{DOMAIN}_rcon"
+RCON_POOL_KEY = f"{DOMAIN}_rcon_pool"
+
+PUSH_API_PATH = f"/api/{DOMAIN}/push"
+FAVICON_API_PATH = f"/api/{DOMAIN}/favicon"
+
+PLATFORMS = ["sensor", "binary_sensor", "image"]
 
@@ -3,15 +3,36 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import re
+import socket
+import time
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import timedelta
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from mcstatus import JavaServer
 
-from .const import DOMAIN, SCAN_PORT_MIN, SCAN_PORT_MAX
+from .const import (
+    DEFAULT_DISCOVERY_SHARDS,
+    DEFAULT_PUSH_LIVENESS_INTERVAL,
+    DOMAIN,
+    MIN_DISCOVERY_TICK,
+    POLL_TIMEOUT_CEILING,
+    SCAN_PORT_MAX,
+    SCAN_PORT_MIN,
+    SCAN_TIMEOUT_CEILING,
+    TIMEOUT_FLOOR,
+    TIMEOUT_RTT_MULTIPLIER,
+)
+from .dualstack import FamilySelector, async_get_family_selector, strip_brackets
+from .favicon import async_get_favicon_cache, favicon_hash
+from .health import HEALTH_KEY, async_get_host_health, is_host_down_error
+from .portmap import PortBitmap, PortMapStore
+from .rcon import McRconData, RconError, RconPool, parse_rcon_metrics
+from .slp import async_java_status
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,6 +51,19 @@ class McServerData:
     modded: bool = False
     mod_count: int = 0
     mod_list: list[dict[str, str]] = field(default_factory=list)
+    favicon_hash: str | None = None
+
+
+def _clamp_shards(port_min: int, port_max: int, shards: int) -> int:
+    """Return the shard count limited to one port per shard."""
+    return max(1, min(shards, port_max - port_min + 1))
+
+
+def _discovery_tick(discovery_interval: int, shards: int) -> timedelta:
+    """Return the interval between discovery ticks for a full-coverage interval."""
+    return timedelta(
+        seconds=max(MIN_DISCOVERY_TICK, discovery_interval / max(1, shards))
+    )
 
 
 def _strip_formatting(text: str) -> str:
@@ -37,30 +71,109 @@ def _strip_formatting(text: str) -> str:
     return re.sub(r"\u00a7.", "", re.sub(r"§.", "", text))
 
 
-async def async_scan_ports(
+class RttTracker:
+    """Rolling window of response times used to derive an adaptive timeout.
+
+    Until enough samples are collected the ceiling is used, afterwards the
+    timeout is a multiple of the observed p99, clamped to floor and ceiling.
+    After a failure the next attempt uses the ceiling again, so a single slow
+    response does not keep a busy server flapping between online and offline.
+    """
+
+    WINDOW = 50
+    MIN_SAMPLES = 5
+
+    def __init__(
+        self, floor: float = TIMEOUT_FLOOR, ceiling: float = POLL_TIMEOUT_CEILING
+    ) -> None:
+        """Initialize the tracker."""
+        self.floor = floor
+        self.ceiling = ceiling
+        self._samples: deque[float] = deque(maxlen=self.WINDOW)
+        self._failed = False
+
+    def add(self, seconds: float) -> None:
+        """Record a successful response time."""
+        self._samples.append(seconds)
+        self._failed = False
+
+    def add_failure(self) -> None:
+        """Record a failed request."""
+        self._failed = True
+
+    @property
+    def p99(self) -> float | None:
+        """Return the 99th percentile of the recorded samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, math.ceil(0.99 * len(ordered)) - 1)]
+
+    @property
+    def timeout(self) -> float:
+        """Return the timeout to use for the next request."""
+        if self._failed or len(self._samples) < self.MIN_SAMPLES:
+            return self.ceiling
+        return min(self.ceiling, max(self.floor, self.p99 * TIMEOUT_RTT_MULTIPLIER))
+
+
+async def async_probe_ports(
     host: str,
-    port_min: int = SCAN_PORT_MIN,
-    port_max: int = SCAN_PORT_MAX,
-    timeout: float = 3.0,
+    ports: Iterable[int],
+    timeout: float = SCAN_TIMEOUT_CEILING,
+    rtt: RttTracker | None = None,
+    families: FamilySelector | None = None,
 ) -> list[int]:
-    """Scan a range of ports on a host for running Minecraft servers."""
+    """Check a set of ports on a host and return those running a Minecraft server.
+
+    If an RTT tracker is given, its adaptive timeout replaces ``timeout`` and
+    the response times of the servers found are fed back into it. If a
+    family selector is given, the remembered address family of the host is
+    used and the family that answered is remembered.
+    """
     found_ports: list[int] = []
+    if rtt is not None:
+        timeout = rtt.timeout
+    target = strip_brackets(host)
+    family = families.async_get(host) if families is not None else socket.AF_UNSPEC
 
     async def _check_port(port: int) -> None:
         try:
-            server = JavaServer(host, port, timeout=timeout)
-            await server.async_status()
+            started = time.perf_counter()
+            _, connected = await async_java_status(target, port, timeout, family)
+            if rtt is not None:
+                rtt.add(time.perf_counter() - started)
+            if families is not None:
+                families.async_set(host, connected)
             found_ports.append(port)
         except Exception:
             pass
 
-    await asyncio.gather(*[_check_port(p) for p in range(port_min, port_max + 1)])
+    await asyncio.gather(*[_check_port(p) for p in ports])
     found_ports.sort()
     return found_ports
 
 
+async def async_scan_ports(
+    host: str,
+    port_min: int = SCAN_PORT_MIN,
+    port_max: int = SCAN_PORT_MAX,
+    timeout: float = SCAN_TIMEOUT_CEILING,
+    rtt: RttTracker | None = None,
+) -> list[int]:
+    """Scan a range of ports on a host for running Minecraft servers."""
+    return await async_probe_ports(
+        host, range(port_min, port_max + 1), timeout=timeout, rtt=rtt
+    )
+
+
 class McServerStatsCoordinator(DataUpdateCoordinator[McServerData]):
-    """Coordinator that polls a single Minecraft server for its status."""
+    """Coordinator that polls a single Minecraft server for its status.
+
+    Servers running a reporting plugin can also push their status through the
+    HTTP API. While pushes keep arriving, polling drops to a slow liveness
+    check and resumes the regular interval once the pushes stop.
+    """
 
     def __init__(
         self,
@@ -68,10 +181,18 @@ class McServerStatsCoordinator(DataUpdateCoordinator[McServerData]):
         host: str,
         port: int,
         update_interval_seconds: int,
+        push_liveness_seconds: int = DEFAULT_PUSH_LIVENESS_INTERVAL,
     ) -> None:
         """Initialize the coordinator."""
         self.host = host
         self.port = port
+        self._poll_interval = timedelta(seconds=update_interval_seconds)
+        self._push_liveness_interval = timedelta(seconds=push_liveness_seconds)
+        self._last_push: float | None = None
+        self.rtt = RttTracker(ceiling=POLL_TIMEOUT_CEILING)
+        self.health = async_get_host_health(hass, host)
+        self.favicons = async_get_favicon_cache(hass)
+        self.families = async_get_family_selector(hass)
 
         super().__init__(
             hass,
@@ -80,11 +201,66 @@ class McServerStatsCoordinator(DataUpdateCoordinator[McServerData]):
             update_interval=timedelta(seconds=update_interval_seconds),
         )
 
+    @property
+    def push_active(self) -> bool:
+        """Return True if the server pushed its status recently."""
+        if self._last_push is None:
+            return False
+        return (
+            time.monotonic() - self._last_push
+            < self._push_liveness_interval.total_seconds()
+        )
+
+    @callback
+    def async_handle_push(self, data: McServerData) -> None:
+        """Apply a status pushed by the server and switch to liveness polling.
+
+        Unlike ``async_set_updated_data`` this keeps the scheduled refresh, so
+        the liveness check still runs on time, counted from the last poll,
+        while pushes keep arriving.
+        """
+        self._last_push = time.monotonic()
+        self.update_interval = self._push_liveness_interval
+        self.health.async_record_success(self.port)
+        self.data = data
+        self.last_update_success = True
+        self.async_update_listeners()
+
+    @callback
+    def async_set_poll_interval(self, update_interval_seconds: int) -> None:
+        """Change the polling interval of the running coordinator."""
+        self._poll_interval = timedelta(seconds=update_interval_seconds)
+        if not self.push_active:
+            self.update_interval = self._poll_interval
+            # Poll now so the new interval is used from here on
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def async_mark_offline(self) -> None:
+        """Report the server offline without polling it (host is down)."""
+        self.async_set_updated_data(McServerData(online=False))
+
     async def _async_update_data(self) -> McServerData:
         """Fetch status from the Minecraft server."""
+        if not self.push_active:
+            # Pushes stopped (or never started) – poll at the regular interval
+            self.update_interval = self._poll_interval
+
+        if self.health.is_open:
+            # The whole host is down – the health tracker probes it for us
+            return McServerData(online=False)
+
         try:
-            server = JavaServer(self.host, self.port, timeout=5)
-            status = await server.async_status()
+            started = time.perf_counter()
+            status, family = await async_java_status(
+                strip_brackets(self.host),
+                self.port,
+                self.rtt.timeout,
+                self.families.async_get(self.host),
+            )
+            self.rtt.add(time.perf_counter() - started)
+            self.families.async_set(self.host, family)
+            self.health.async_record_success(self.port)
 
             motd_text = ""
             if hasattr(status, "motd") and status.motd is not None:
@@ -111,6 +287,13 @@ class McServerStatsCoordinator(DataUpdateCoordinator[McServerData]):
                 ]
                 mod_count = len(mod_list)
 
+            # Only a favicon that is not cached yet gets decoded
+            icon_hash: str | None = None
+            if status.icon:
+                icon_hash = favicon_hash(status.icon)
+                if not self.favicons.add(icon_hash, status.icon):
+                    icon_hash = None
+
             return McServerData(
                 online=True,
                 players_online=status.players.online if status.players else 0,
@@ -122,13 +305,29 @@ class McServerStatsCoordinator(DataUpdateCoordinator[McServerData]):
                 modded=modded,
                 mod_count=mod_count,
                 mod_list=mod_list,
+                favicon_hash=icon_hash,
             )
-        except Exception:
+        except ConnectionRefusedError:
+            # The host answered, only this server is not running
+            self.health.async_record_success(self.port)
+            return McServerData(online=False)
+        except Exception as err:
+            self.rtt.add_failure()
+            if is_host_down_error(err):
+                # The remembered family may be the broken one, race again next time
+                self.families.async_forget(self.host)
+                self.health.async_record_failure(self.port)
             return McServerData(online=False)
 
 
 class McDiscoveryCoordinator(DataUpdateCoordinator[list[int]]):
-    """Coordinator that periodically scans for new Minecraft servers on a host."""
+    """Coordinator that periodically scans for new Minecraft servers on a host.
+
+    The port range is split into shards and every tick scans one shard plus
+    all ports that were live recently, so the whole range is covered once per
+    discovery interval without one big burst. Live ports are kept in a bitmap
+    that survives restarts. With a single shard every tick scans the full range.
+    """
 
     def __init__(
         self,
@@ -137,24 +336,155 @@ class McDiscoveryCoordinator(DataUpdateCoordinator[list[int]]):
         update_interval_seconds: int,
         port_min: int = SCAN_PORT_MIN,
         port_max: int = SCAN_PORT_MAX,
+        shards: int = DEFAULT_DISCOVERY_SHARDS,
+        port_map: PortMapStore | None = None,
     ) -> None:
         """Initialize the discovery coordinator."""
         self.host = host
         self.port_min = port_min
         self.port_max = port_max
+        self.shards = _clamp_shards(port_min, port_max, shards)
+        self.rtt = RttTracker(ceiling=SCAN_TIMEOUT_CEILING)
+        self.families = async_get_family_selector(hass)
+        self._port_map = port_map
+        self._bitmap = PortBitmap(port_min, port_max)
+        self._shard_index = 0
 
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_discovery_{host}",
-            update_interval=timedelta(seconds=update_interval_seconds),
+            update_interval=_discovery_tick(update_interval_seconds, self.shards),
         )
 
+    @callback
+    def async_configure(
+        self,
+        update_interval_seconds: int,
+        port_min: int,
+        port_max: int,
+        shards: int,
+    ) -> None:
+        """Apply new discovery settings to the running coordinator."""
+        shards = _clamp_shards(port_min, port_max, shards)
+        update_interval = _discovery_tick(update_interval_seconds, shards)
+        if (self.port_min, self.port_max, self.shards, self.update_interval) == (
+            port_min,
+            port_max,
+            shards,
+            update_interval,
+        ):
+            return
+
+        self.port_min = port_min
+        self.port_max = port_max
+        self.shards = shards
+        self.update_interval = update_interval
+        self._shard_index = 0
+        # Scan now so the new range and interval take effect immediately
+        self.hass.async_create_task(self.async_request_refresh())
+
+    def _ports_for_tick(self) -> list[int]:
+        """Return the ports to scan this tick: the next shard and all live ports."""
+        if self.shards <= 1:
+            return list(range(self.port_min, self.port_max + 1))
+
+        # Split evenly so no shard is empty, sizes differ by at most one port
+        count = self.port_max - self.port_min + 1
+        self._shard_index %= self.shards
+        start = self.port_min + self._shard_index * count // self.shards
+        end = self.port_min + (self._shard_index + 1) * count // self.shards
+        self._shard_index += 1
+
+        ports = set(range(start, end))
+        ports.update(self._bitmap.live_ports())
+        return sorted(ports)
+
     async def _async_update_data(self) -> list[int]:
-        """Scan for Minecraft servers and return the list of open ports."""
+        """Scan the ports due this tick and return all live ports."""
+        health = self.hass.data.get(HEALTH_KEY, {}).get(self.host)
+        if health is not None and health.is_open:
+            _LOGGER.debug("Skipping discovery scan, host %s is down", self.host)
+            return self.data or []
+
+        if self._port_map is not None:
+            self._bitmap = self._port_map.async_get(
+                self.host, self.port_min, self.port_max
+            )
+        elif (self._bitmap.port_min, self._bitmap.port_max) != (
+            self.port_min,
+            self.port_max,
+        ):
+            self._bitmap = self._bitmap.resized(self.port_min, self.port_max)
+
+        ports = self._ports_for_tick()
+        if not ports:
+            return self.data or []
+
         try:
-            return await async_scan_ports(self.host, self.port_min, self.port_max)
+            found = await async_probe_ports(
+                self.host, ports, rtt=self.rtt, families=self.families
+            )
         except Exception:
             _LOGGER.debug("Discovery scan failed for %s", self.host)
             return self.data or []
 
+        if not found and self.data:
+            # Known servers vanished – give the next scan the full timeout
+            self.rtt.add_failure()
+            self.families.async_forget(self.host)
+
+        found_set = set(found)
+        changed = False
+        for port in ports:
+            changed |= self._bitmap.set(port, port in found_set)
+        if changed and self._port_map is not None:
+            self._port_map.async_schedule_save()
+
+        return self._bitmap.live_ports()
+
+
+class McRconCoordinator(DataUpdateCoordinator[McRconData]):
+    """Coordinator that reads performance metrics from a server over RCON."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        pool: RconPool,
+        host: str,
+        rcon_port: int,
+        password: str,
+        commands: list[str],
+        update_interval_seconds: int,
+    ) -> None:
+        """Initialize the RCON coordinator."""
+        self.host = host
+        self.rcon_port = rcon_port
+        self._pool = pool
+        self._password = password
+        self._commands = commands
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_rcon_{host}_{rcon_port}",
+            update_interval=timedelta(seconds=update_interval_seconds),
+        )
+
+    async def _async_update_data(self) -> McRconData:
+        """Run the command batch and parse the responses."""
+        try:
+            responses = await self._pool.async_run_batch(
+                strip_brackets(self.host),
+                self.rcon_port,
+                self._password,
+                self._commands,
+            )
+        except RconError as err:
+            _LOGGER.debug("RCON update failed: %s", err)
+            return McRconData()
+        return parse_rcon_metrics(responses)
+
+    async def async_release(self) -> None:
+        """Close the pooled RCON connection of this server."""
+        await self._pool.async_release(strip_brackets(self.host), self.rcon_port)
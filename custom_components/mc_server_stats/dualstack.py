@@ -0,0 +1,69 @@
+"""Address family selection for hosts with both IPv6 and IPv4 addresses."""
+from __future__ import annotations
+
+import logging
+import socket
+import time
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+FAMILIES_KEY = f"{DOMAIN}_families"
+
+FAMILY_TTL = 600  # seconds
+
+
+def strip_brackets(host: str) -> str:
+    """Return a host without the brackets of a bracketed IPv6 literal."""
+    if host.startswith("[") and host.endswith("]"):
+        return host[1:-1]
+    return host
+
+
+class FamilySelector:
+    """Remembers which address family of a dual-stack host answers.
+
+    Status requests race IPv6 and IPv4 (RFC 8305) while the family of a
+    host is unknown. The family that answered is remembered, so later polls
+    and scans connect straight to it instead of trying a broken family
+    first, until it fails or expires. The name is always what is connected
+    to, so the hostname stays in the handshake.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the selector."""
+        self._families: dict[str, tuple[int, float]] = {}
+
+    @callback
+    def async_get(self, host: str) -> int:
+        """Return the family to connect with, AF_UNSPEC to race."""
+        if (cached := self._families.get(host)) and cached[1] > time.monotonic():
+            return cached[0]
+        return socket.AF_UNSPEC
+
+    @callback
+    def async_set(self, host: str, family: int) -> None:
+        """Remember the family that answered for a host."""
+        if host not in self._families:
+            _LOGGER.debug(
+                "Using %s for %s",
+                "IPv6" if family == socket.AF_INET6 else "IPv4",
+                host,
+            )
+        self._families[host] = (family, time.monotonic() + FAMILY_TTL)
+
+    @callback
+    def async_forget(self, host: str) -> None:
+        """Forget the family of a host so the next connect races again."""
+        self._families.pop(host, None)
+
+
+@callback
+def async_get_family_selector(hass: HomeAssistant) -> FamilySelector:
+    """Return the shared family selector."""
+    if (selector := hass.data.get(FAMILIES_KEY)) is None:
+        selector = hass.data[FAMILIES_KEY] = FamilySelector()
+    return selector
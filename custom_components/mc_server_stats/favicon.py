@@ -0,0 +1,113 @@
+"""Server favicons: decoding, a bounded in-memory cache and an HTTP view."""
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+from collections import OrderedDict
+from http import HTTPStatus
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, FAVICON_API_PATH
+
+FAVICON_KEY = f"{DOMAIN}_favicons"
+
+MAX_CACHE_BYTES = 2 * 1024 * 1024
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+DATA_URL_PREFIX = "data:image/png;base64,"
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def favicon_hash(raw: str) -> str:
+    """Return the content hash of a favicon as sent in the status response."""
+    return hashlib.sha256(raw.encode("ascii", "replace")).hexdigest()[:16]
+
+
+def decode_favicon(raw: str) -> bytes | None:
+    """Decode a base64 data URL into PNG bytes, or None if it is not a PNG."""
+    if raw.startswith(DATA_URL_PREFIX):
+        raw = raw[len(DATA_URL_PREFIX) :]
+    try:
+        data = base64.b64decode(raw.replace("\n", ""), validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return data if data.startswith(PNG_SIGNATURE) else None
+
+
+class FaviconCache:
+    """Decoded favicons by content hash, evicting the least recently used.
+
+    Servers sharing an icon share one entry, and an icon is decoded only
+    when a server reports a hash that is not cached yet.
+    """
+
+    def __init__(self, max_bytes: int = MAX_CACHE_BYTES) -> None:
+        """Initialize the cache."""
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._images: OrderedDict[str, bytes] = OrderedDict()
+
+    def __contains__(self, digest: str) -> bool:
+        """Return True if a favicon is cached."""
+        return digest in self._images
+
+    def get(self, digest: str) -> bytes | None:
+        """Return the PNG bytes of a favicon."""
+        if (image := self._images.get(digest)) is not None:
+            self._images.move_to_end(digest)
+        return image
+
+    def add(self, digest: str, raw: str) -> bool:
+        """Decode and cache a favicon, return False if it is not a valid PNG."""
+        if digest in self._images:
+            self._images.move_to_end(digest)
+            return True
+        image = decode_favicon(raw)
+        if image is None or len(image) > self.max_bytes:
+            return False
+
+        self._images[digest] = image
+        self.size += len(image)
+        while self.size > self.max_bytes:
+            _, evicted = self._images.popitem(last=False)
+            self.size -= len(evicted)
+        return True
+
+
+@callback
+def async_get_favicon_cache(hass: HomeAssistant) -> FaviconCache:
+    """Return the shared favicon cache."""
+    if (cache := hass.data.get(FAVICON_KEY)) is None:
+        cache = hass.data[FAVICON_KEY] = FaviconCache()
+    return cache
+
+
+class McServerFaviconView(HomeAssistantView):
+    """Serve cached favicons under their content hash.
+
+    The URL changes whenever the icon does, so responses can be cached
+    forever and dashboards only download an icon again after it changed.
+    No authentication is needed: servers hand out their favicon to anyone
+    who pings them, and only icons of configured servers are cached.
+    """
+
+    url = f"{FAVICON_API_PATH}/{{favicon_hash}}"
+    name = f"api:{DOMAIN}:favicon"
+    requires_auth = False
+
+    async def get(self, request: web.Request, favicon_hash: str) -> web.Response:
+        """Return a favicon, or 304 if the client already has it."""
+        hass: HomeAssistant = request.app[KEY_HASS]
+        etag = f'"{favicon_hash}"'
+        headers = {hdrs.ETAG: etag, hdrs.CACHE_CONTROL: CACHE_CONTROL}
+
+        image = async_get_favicon_cache(hass).get(favicon_hash)
+        if image is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        if etag in request.headers.get(hdrs.IF_NONE_MATCH, ""):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+        return web.Response(body=image, content_type="image/png", headers=headers)
@@ -0,0 +1,203 @@
+"""Host-level health tracking with a circuit breaker for Minecraft Server Stats."""
+from __future__ import annotations
+
+import asyncio
+import errno
+import logging
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, HAPPY_EYEBALLS_DELAY, POLL_TIMEOUT_CEILING
+from .dualstack import strip_brackets
+
+if TYPE_CHECKING:
+    from .coordinator import McServerStatsCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+HEALTH_KEY = f"{DOMAIN}_health"
+
+HOST_FAILURE_THRESHOLD = 3
+HOST_FAILURE_MIN_SERVERS = 2  # one server timing out says nothing about its host
+PROBE_BACKOFF_MIN = 10  # seconds
+PROBE_BACKOFF_MAX = 300  # seconds
+
+# Errors that mean the machine itself is unreachable, not just one server
+HOST_DOWN_ERRNOS = {errno.EHOSTUNREACH, errno.ENETUNREACH, errno.EHOSTDOWN}
+
+
+def is_host_down_error(err: BaseException) -> bool:
+    """Return True if an exception indicates that the whole host is unreachable."""
+    if isinstance(err, TimeoutError):
+        return True
+    return isinstance(err, OSError) and err.errno in HOST_DOWN_ERRNOS
+
+
+class HostHealth:
+    """Tracks failures across all servers of a host and trips a circuit breaker.
+
+    When several servers of a host time out within one poll interval, the
+    circuit opens: all servers are marked offline at once and polling stops.
+    A single cheap TCP connect probes the host on a backoff, and once it
+    answers the circuit closes and every server is refreshed. If the servers
+    fail again right away, the probe backoff continues where it left off.
+    Hosts with a single server never open the circuit.
+    """
+
+    def __init__(self, hass: HomeAssistant, host: str) -> None:
+        """Initialize the host health tracker."""
+        self.hass = hass
+        self.host = host
+        self.is_open = False
+        self._coordinators: set[McServerStatsCoordinator] = set()
+        self._failed_ports: dict[int, float] = {}
+        self._probe_attempts = 0
+        self._closed_at: float | None = None
+        self._unsub_probe: Callable[[], None] | None = None
+
+    @callback
+    def async_register(
+        self, coordinator: McServerStatsCoordinator
+    ) -> Callable[[], None]:
+        """Register a server coordinator and return a callback to unregister it."""
+        self._coordinators.add(coordinator)
+
+        @callback
+        def _unregister() -> None:
+            self._coordinators.discard(coordinator)
+            self._failed_ports.pop(coordinator.port, None)
+            if not self._coordinators:
+                self._cancel_probe()
+                self.hass.data.get(HEALTH_KEY, {}).pop(self.host, None)
+
+        return _unregister
+
+    @property
+    def _window(self) -> float:
+        """Return how long a failure counts: one poll of the slowest server."""
+        return POLL_TIMEOUT_CEILING + max(
+            (
+                coordinator.update_interval.total_seconds()
+                for coordinator in self._coordinators
+                if coordinator.update_interval is not None
+            ),
+            default=0.0,
+        )
+
+    @callback
+    def async_record_success(self, port: int) -> None:
+        """Record that the host answered on a port."""
+        self._failed_ports.pop(port, None)
+        if self.is_open:
+            self._async_close()
+
+    @callback
+    def async_record_failure(self, port: int) -> None:
+        """Record that a port did not answer because the host seems down."""
+        now = time.monotonic()
+        self._failed_ports[port] = now
+        if self.is_open or len(self._coordinators) < HOST_FAILURE_MIN_SERVERS:
+            return
+
+        # Only failures from the current poll interval count, older ones
+        # belong to a different outage (or a single slow server)
+        cutoff = now - self._window
+        self._failed_ports = {
+            failed_port: failed_at
+            for failed_port, failed_at in self._failed_ports.items()
+            if failed_at >= cutoff
+        }
+        if len(self._failed_ports) >= min(
+            HOST_FAILURE_THRESHOLD, len(self._coordinators)
+        ):
+            self._async_open()
+
+    @callback
+    def _async_open(self) -> None:
+        """Open the circuit and mark every server of the host offline."""
+        _LOGGER.info(
+            "Host %s is unreachable, suspending polling of %d server(s)",
+            self.host,
+            len(self._coordinators),
+        )
+        self.is_open = True
+        # A probe only shows that the host accepts connections, not that the
+        # servers answer. If they failed again right after the circuit
+        # closed, keep backing off instead of probing every 10 s again.
+        if (
+            self._closed_at is None
+            or time.monotonic() - self._closed_at > self._window
+        ):
+            self._probe_attempts = 0
+        for coordinator in self._coordinators:
+            coordinator.async_mark_offline()
+        self._schedule_probe()
+
+    @callback
+    def _async_close(self) -> None:
+        """Close the circuit and resume polling."""
+        _LOGGER.info("Host %s is reachable again, resuming polling", self.host)
+        self.is_open = False
+        self._closed_at = time.monotonic()
+        self._failed_ports.clear()
+        self._cancel_probe()
+        for coordinator in self._coordinators:
+            self.hass.async_create_task(coordinator.async_request_refresh())
+
+    def _schedule_probe(self) -> None:
+        delay = min(PROBE_BACKOFF_MIN * 2**self._probe_attempts, PROBE_BACKOFF_MAX)
+        self._probe_attempts += 1
+
+        @callback
+        def _probe(_now: datetime) -> None:
+            self._unsub_probe = None
+            self.hass.async_create_task(self._async_probe())
+
+        self._unsub_probe = async_call_later(self.hass, delay, HassJob(_probe))
+
+    def _cancel_probe(self) -> None:
+        if self._unsub_probe is not None:
+            self._unsub_probe()
+            self._unsub_probe = None
+
+    async def _async_probe(self) -> None:
+        """Try a single TCP connect to see whether the host is back."""
+        if not self.is_open or not self._coordinators:
+            return
+
+        port = min(coordinator.port for coordinator in self._coordinators)
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    strip_brackets(self.host),
+                    port,
+                    happy_eyeballs_delay=HAPPY_EYEBALLS_DELAY,
+                ),
+                POLL_TIMEOUT_CEILING,
+            )
+            writer.close()
+        except ConnectionRefusedError:
+            # A refused connection still means the machine is up
+            pass
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Host %s still unreachable: %s", self.host, err)
+            if self.is_open:
+                self._schedule_probe()
+            return
+
+        if self.is_open:
+            self._async_close()
+
+
+@callback
+def async_get_host_health(hass: HomeAssistant, host: str) -> HostHealth:
+    """Return the shared health tracker for a host."""
+    trackers: dict[str, HostHealth] = hass.data.setdefault(HEALTH_KEY, {})
+    if host not in trackers:
+        trackers[host] = HostHealth(hass, host)
+    return trackers[host]
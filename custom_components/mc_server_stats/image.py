@@ -0,0 +1,94 @@
+"""Image platform for Minecraft Server Stats."""
+from __future__ import annotations
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_HOST, CONF_SERVER_NAME, DOMAIN, FAVICON_API_PATH
+from .coordinator import McServerStatsCoordinator
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Minecraft Server Stats favicon images for all servers of a host."""
+    coordinators: dict[str, McServerStatsCoordinator] = hass.data[DOMAIN][entry.entry_id]
+    host = entry.data[CONF_HOST]
+
+    for subentry_id, coordinator in coordinators.items():
+        custom_name = entry.subentries[subentry_id].data.get(CONF_SERVER_NAME)
+        async_add_entities(
+            [McServerFaviconImage(hass, coordinator, host, coordinator.port, custom_name)],
+            config_subentry_id=subentry_id,
+        )
+
+
+class McServerFaviconImage(CoordinatorEntity[McServerStatsCoordinator], ImageEntity):
+    """Image of the server favicon.
+
+    The state only changes when the icon does, and the picture URL is the
+    content-hashed favicon endpoint instead of the token-protected image
+    proxy, so browsers can keep the icon cached across token rotations.
+    The last icon is kept while the server is offline.
+    """
+
+    _attr_has_entity_name = True
+    _attr_content_type = "image/png"
+
+    def __init__(self, hass, coordinator, host, port, custom_name=None):
+        """Initialize the image."""
+        CoordinatorEntity.__init__(self, coordinator)
+        ImageEntity.__init__(self, hass)
+        self._host = host
+        self._port = port
+        self._favicon_hash: str | None = None
+
+        self._attr_unique_id = f"{host}_{port}_favicon"
+        self._attr_name = "Favicon"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{host}:{port}")},
+            name=custom_name or f"Minecraft Server {host}:{port}",
+            manufacturer="Mojang",
+            model="Minecraft Java Server",
+        )
+        self._update_favicon()
+
+    def _update_favicon(self) -> bool:
+        """Pick up a changed favicon hash, return True if it changed."""
+        data = self.coordinator.data
+        if data is None or not data.favicon_hash or data.favicon_hash == self._favicon_hash:
+            return False
+        self._favicon_hash = data.favicon_hash
+        self._attr_image_last_updated = dt_util.utcnow()
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the favicon changed."""
+        if self._update_favicon():
+            self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return True once a favicon is known."""
+        return self._favicon_hash is not None
+
+    @property
+    def entity_picture(self) -> str | None:
+        """Return the content-hashed URL of the favicon."""
+        if self._favicon_hash is None:
+            return None
+        return f"{FAVICON_API_PATH}/{self._favicon_hash}"
+
+    async def async_image(self) -> bytes | None:
+        """Return the PNG bytes of the favicon."""
+        if self._favicon_hash is None:
+            return None
+        return self.coordinator.favicons.get(self._favicon_hash)
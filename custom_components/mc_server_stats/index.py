@@ -0,0 +1,138 @@
+"""Index of configured and pending servers for Minecraft Server Stats."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    SOURCE_IGNORE,
+    ConfigEntry,
+    ConfigEntryChange,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import CONF_HOST, CONF_MERGED_INTO, CONF_PORT, DOMAIN, SUBENTRY_TYPE_SERVER
+
+INDEX_KEY = f"{DOMAIN}_index"
+
+
+def _entry_addresses(entry: ConfigEntry) -> list[tuple[str, int]]:
+    """Return the (host, port) pairs of all servers an entry covers."""
+    if entry.source == SOURCE_IGNORE:
+        # Ignored discoveries carry no data, only the "host:port" unique ID
+        host, _, port = (entry.unique_id or "").rpartition(":")
+        if not host or not port.isdigit():
+            return []
+        return [(host, int(port))]
+
+    if CONF_HOST not in entry.data or CONF_MERGED_INTO in entry.data:
+        return []
+    host = entry.data[CONF_HOST]
+    if CONF_PORT in entry.data:
+        # Per-server entry that has not been migrated yet
+        return [(host, entry.data[CONF_PORT])]
+    return [
+        (host, subentry.data[CONF_PORT])
+        for subentry in entry.subentries.values()
+        if subentry.subentry_type == SUBENTRY_TYPE_SERVER
+    ]
+
+
+class ServerIndex:
+    """Maps hosts to their configured, ignored and pending ports.
+
+    Kept up to date as entries and their server subentries are added or
+    removed and as discovery flows start and finish, so discovery can
+    reconcile without scanning every config entry and flow.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._entries: dict[str, dict[int, str]] = {}
+        self._ignored: dict[str, set[int]] = {}
+        self._pending: dict[str, dict[int, str]] = {}
+        self._by_entry: dict[str, list[tuple[str, int]]] = {}
+
+    @callback
+    def async_add_entry(self, entry: ConfigEntry) -> None:
+        """Add a config entry, replacing what was indexed for it before."""
+        self.async_remove_entry(entry)
+        addresses = _entry_addresses(entry)
+        if not addresses:
+            return
+        self._by_entry[entry.entry_id] = addresses
+        for host, port in addresses:
+            if entry.source == SOURCE_IGNORE:
+                self._ignored.setdefault(host, set()).add(port)
+            else:
+                self._entries.setdefault(host, {})[port] = entry.entry_id
+
+    @callback
+    def async_remove_entry(self, entry: ConfigEntry) -> None:
+        """Remove a config entry."""
+        for host, port in self._by_entry.pop(entry.entry_id, ()):
+            if self._entries.get(host, {}).get(port) == entry.entry_id:
+                del self._entries[host][port]
+                if not self._entries[host]:
+                    del self._entries[host]
+            if entry.source == SOURCE_IGNORE and host in self._ignored:
+                self._ignored[host].discard(port)
+                if not self._ignored[host]:
+                    del self._ignored[host]
+
+    @callback
+    def async_add_pending(self, host: str, port: int, flow_id: str) -> None:
+        """Add a discovery flow that is waiting for confirmation."""
+        self._pending.setdefault(host, {})[port] = flow_id
+
+    @callback
+    def async_remove_pending(self, host: str, port: int, flow_id: str) -> None:
+        """Remove a finished or aborted discovery flow."""
+        if self._pending.get(host, {}).get(port) == flow_id:
+            del self._pending[host][port]
+            if not self._pending[host]:
+                del self._pending[host]
+
+    def is_known(self, host: str, port: int) -> bool:
+        """Return True if a server is configured, ignored or pending."""
+        return (
+            port in self._entries.get(host, {})
+            or port in self._ignored.get(host, ())
+            or port in self._pending.get(host, {})
+        )
+
+    def configured_ports(self, host: str) -> set[int]:
+        """Return the ports of a host that belong to a configured server."""
+        return set(self._entries.get(host, {}))
+
+    def unknown_ports(self, host: str, ports: Iterable[int]) -> list[int]:
+        """Return the ports of a host that are neither configured nor pending."""
+        return [port for port in ports if not self.is_known(host, port)]
+
+    def entry_ids(self, host: str) -> set[str]:
+        """Return the IDs of all config entries for a host."""
+        return set(self._entries.get(host, {}).values())
+
+
+@callback
+def async_get_index(hass: HomeAssistant) -> ServerIndex:
+    """Return the server index, building it from the config entries on first use."""
+    if (index := hass.data.get(INDEX_KEY)) is not None:
+        return index
+
+    index = hass.data[INDEX_KEY] = ServerIndex()
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        index.async_add_entry(entry)
+
+    @callback
+    def _async_entry_changed(change: ConfigEntryChange, entry: ConfigEntry) -> None:
+        if entry.domain != DOMAIN:
+            return
+        if change in (ConfigEntryChange.ADDED, ConfigEntryChange.UPDATED):
+            index.async_add_entry(entry)
+        elif change is ConfigEntryChange.REMOVED:
+            index.async_remove_entry(entry)
+
+    async_dispatcher_connect(hass, SIGNAL_CONFIG_ENTRY_CHANGED, _async_entry_changed)
+    return index
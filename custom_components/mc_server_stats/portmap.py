@@ -0,0 +1,116 @@
+"""Persistent per-host bitmaps of live ports for sharded discovery."""
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_KEY = f"{DOMAIN}.port_map"
+STORAGE_VERSION = 1
+SAVE_DELAY = 60  # seconds
+
+
+class PortBitmap:
+    """One bit per port of a range, set while a server answers on that port."""
+
+    def __init__(self, port_min: int, port_max: int, bits: bytes | None = None) -> None:
+        """Initialize the bitmap."""
+        self.port_min = port_min
+        self.port_max = port_max
+        size = (port_max - port_min) // 8 + 1
+        self._bits = bytearray(bits[:size] if bits else b"")
+        self._bits.extend(bytes(size - len(self._bits)))
+
+    def __contains__(self, port: int) -> bool:
+        """Return True if the port is marked live."""
+        if not self.port_min <= port <= self.port_max:
+            return False
+        offset = port - self.port_min
+        return bool(self._bits[offset >> 3] & (1 << (offset & 7)))
+
+    def set(self, port: int, live: bool) -> bool:
+        """Mark a port live or dead and return True if that changed its state."""
+        if not self.port_min <= port <= self.port_max or (port in self) == live:
+            return False
+        offset = port - self.port_min
+        self._bits[offset >> 3] ^= 1 << (offset & 7)
+        return True
+
+    def live_ports(self) -> list[int]:
+        """Return all live ports in ascending order."""
+        ports: list[int] = []
+        for index, byte in enumerate(self._bits):
+            if not byte:
+                continue
+            for bit in range(8):
+                if byte & (1 << bit):
+                    port = self.port_min + (index << 3) + bit
+                    if port <= self.port_max:
+                        ports.append(port)
+        return ports
+
+    def resized(self, port_min: int, port_max: int) -> PortBitmap:
+        """Return a bitmap for a new range that keeps the overlapping bits."""
+        resized = PortBitmap(port_min, port_max)
+        for port in self.live_ports():
+            resized.set(port, True)
+        return resized
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize the bitmap for storage."""
+        return {
+            "port_min": self.port_min,
+            "port_max": self.port_max,
+            "bits": base64.b64encode(bytes(self._bits)).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PortBitmap:
+        """Restore a bitmap from storage."""
+        return cls(
+            data["port_min"], data["port_max"], base64.b64decode(data["bits"])
+        )
+
+
+class PortMapStore:
+    """Holds the live-port bitmaps of all hosts and persists them across restarts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._maps: dict[str, PortBitmap] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored bitmaps."""
+        data = await self._store.async_load() or {}
+        for host, bitmap in data.get("hosts", {}).items():
+            try:
+                self._maps.setdefault(host, PortBitmap.from_dict(bitmap))
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    @callback
+    def async_get(self, host: str, port_min: int, port_max: int) -> PortBitmap:
+        """Return the bitmap of a host covering the given port range."""
+        bitmap = self._maps.get(host)
+        if bitmap is None:
+            bitmap = PortBitmap(port_min, port_max)
+        elif (bitmap.port_min, bitmap.port_max) != (port_min, port_max):
+            bitmap = bitmap.resized(port_min, port_max)
+        self._maps[host] = bitmap
+        return bitmap
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the bitmaps after a short delay, coalescing frequent changes."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "hosts": {host: bitmap.as_dict() for host, bitmap in self._maps.items()}
+        }
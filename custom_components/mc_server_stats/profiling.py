@@ -0,0 +1,246 @@
+"""On-demand profiling of the integration, started by a service call."""
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILER_KEY = f"{DOMAIN}_profiler"
+
+LAG_INTERVAL = 0.05  # seconds
+TOP_ALLOCATIONS = 25
+PACKAGE_DIR = str(Path(__file__).parent)
+
+
+@dataclass
+class _Timing:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+def _targets() -> list[tuple[type, str, str]]:
+    """Return the (class, method, category) pairs that are timed."""
+    from .binary_sensor import McServerOnlineBinarySensor
+    from .coordinator import (
+        McDiscoveryCoordinator,
+        McRconCoordinator,
+        McServerStatsCoordinator,
+    )
+    from .image import McServerFaviconImage
+    from .sensor import McRconSensorBase, McServerSensorBase
+
+    coordinators = (McServerStatsCoordinator, McDiscoveryCoordinator, McRconCoordinator)
+    entities = (
+        McServerSensorBase,
+        McRconSensorBase,
+        McServerOnlineBinarySensor,
+        McServerFaviconImage,
+    )
+    return [
+        *((cls, "_async_update_data", "update") for cls in coordinators),
+        *((cls, "async_update_listeners", "callbacks") for cls in coordinators),
+        *((cls, "async_write_ha_state", "entity state") for cls in entities),
+    ]
+
+
+def _compare_snapshots(
+    before: tracemalloc.Snapshot, after: tracemalloc.Snapshot
+) -> tuple[list[Any], list[Any]]:
+    """Return the allocation diffs, all code and this integration (blocking)."""
+    package = [tracemalloc.Filter(True, f"{PACKAGE_DIR}/*")]
+    diff = after.compare_to(before, "lineno")
+    own = after.filter_traces(package).compare_to(
+        before.filter_traces(package), "lineno"
+    )
+    return diff, own
+
+
+class Profiler:
+    """Times the integration's coordinators and entities for a bounded window.
+
+    The methods are wrapped only while profiling runs, so nothing is
+    measured (or slowed down) otherwise. Synchronous entries are pure
+    event-loop blocking time; coordinator updates include waiting for the
+    network. Event-loop lag and a tracemalloc diff cover the same window.
+    """
+
+    def __init__(self, hass: HomeAssistant, duration: float) -> None:
+        """Initialize the profiler."""
+        self.hass = hass
+        self.duration = duration
+        self.started = dt_util.utcnow()
+        self.timings: dict[tuple[str, str], _Timing] = {}
+        self.lag: list[float] = []
+        self._originals: list[tuple[type, str, Any]] = []
+        self._lag_task: asyncio.Task[None] | None = None
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._started_tracemalloc = False
+
+    def _wrap(self, cls: type, name: str, category: str) -> None:
+        # Only restore what the class defines itself, inherited methods are
+        # restored by deleting the wrapper again
+        own = cls.__dict__.get(name)
+        func = getattr(cls, name)
+        key = (category, cls.__name__)
+        timing = self.timings.setdefault(key, _Timing())
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                started = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    timing.add(time.perf_counter() - started)
+
+        else:
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    timing.add(time.perf_counter() - started)
+
+        self._originals.append((cls, name, own))
+        setattr(cls, name, wrapper)
+
+    async def _measure_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + LAG_INTERVAL
+            await asyncio.sleep(LAG_INTERVAL)
+            self.lag.append(max(0.0, loop.time() - expected))
+
+    @callback
+    def async_start(self) -> None:
+        """Wrap the methods and start measuring."""
+        for cls, name, category in _targets():
+            self._wrap(cls, name, category)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._snapshot = tracemalloc.take_snapshot()
+        self._lag_task = self.hass.async_create_background_task(
+            self._measure_lag(), f"{DOMAIN} loop lag"
+        )
+
+    async def async_stop(self) -> tuple[list[Any], list[Any]]:
+        """Restore the methods and return the allocation diffs (all, this integration)."""
+        for cls, name, own in reversed(self._originals):
+            if own is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, own)
+        self._originals.clear()
+
+        snapshot = tracemalloc.take_snapshot()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        assert self._snapshot is not None
+        before, self._snapshot = self._snapshot, None
+        try:
+            return await self.hass.async_add_executor_job(
+                _compare_snapshots, before, snapshot
+            )
+        finally:
+            if self._lag_task is not None:
+                self._lag_task.cancel()
+
+    def report(self, diff: list[Any], own: list[Any]) -> str:
+        """Return the results as text."""
+        lines = [
+            f"Minecraft Server Stats profile, {self.started.isoformat()}, "
+            f"{self.duration:.0f}s",
+            "",
+            f"{'category':<14} {'name':<28} {'calls':>7} {'total ms':>10} "
+            f"{'mean ms':>9} {'max ms':>9}",
+        ]
+        for (category, name), timing in sorted(
+            self.timings.items(), key=lambda item: -item[1].total
+        ):
+            if not timing.count:
+                continue
+            lines.append(
+                f"{category:<14} {name:<28} {timing.count:>7} "
+                f"{timing.total * 1000:>10.2f} "
+                f"{timing.total / timing.count * 1000:>9.3f} {timing.max * 1000:>9.3f}"
+            )
+
+        lag = sorted(self.lag)
+        lines += ["", "Event loop lag"]
+        if lag:
+            lines.append(
+                f"samples {len(lag)}, mean {sum(lag) / len(lag) * 1000:.2f} ms, "
+                f"p99 {lag[min(len(lag) - 1, int(len(lag) * 0.99))] * 1000:.2f} ms, "
+                f"max {lag[-1] * 1000:.2f} ms"
+            )
+
+        for title, stats in (("this integration", own), ("all code", diff)):
+            lines += [
+                "",
+                f"Memory growth, {title}: "
+                f"{sum(stat.size_diff for stat in stats) / 1024:+.1f} KiB",
+            ]
+            lines += [str(stat) for stat in stats[:TOP_ALLOCATIONS]]
+        return "\n".join(lines) + "\n"
+
+
+async def async_profile(hass: HomeAssistant, duration: float) -> None:
+    """Start a profiling window and write the report when it ends."""
+    if hass.data.get(PROFILER_KEY) is not None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="profiling_running"
+        )
+
+    profiler = hass.data[PROFILER_KEY] = Profiler(hass, duration)
+    profiler.async_start()
+    _LOGGER.info("Profiling for %d seconds", duration)
+
+    async def _finish() -> None:
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            try:
+                diff, own = await profiler.async_stop()
+            finally:
+                hass.data.pop(PROFILER_KEY, None)
+
+        report = profiler.report(diff, own)
+        path = hass.config.path(
+            f"{DOMAIN}_profile_{profiler.started.strftime('%Y%m%d_%H%M%S')}.txt"
+        )
+        await hass.async_add_executor_job(Path(path).write_text, report)
+        _LOGGER.info("Profile written to %s", path)
+        persistent_notification.async_create(
+            hass,
+            f"Profile written to `{path}`.",
+            title="Minecraft Server Stats",
+            notification_id=f"{DOMAIN}_profile",
+        )
+
+    hass.async_create_background_task(_finish(), f"{DOMAIN} profiling")
+
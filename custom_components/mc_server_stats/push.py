@@ -0,0 +1,112 @@
+"""HTTP endpoint for servers that push their status to Home Assistant."""
+from __future__ import annotations
+
+import dataclasses
+import logging
+from http import HTTPStatus
+
+import voluptuous as vol
+from aiohttp import web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, PUSH_API_PATH
+from .coordinator import McServerData, McServerStatsCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 500
+
+SERVER_PUSH_SCHEMA = vol.Schema(
+    {
+        vol.Required("host"): str,
+        vol.Required("port"): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
+        vol.Optional("online", default=True): bool,
+        vol.Optional("players_online"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("players_max"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("motd"): str,
+        vol.Optional("version"): str,
+        vol.Optional("latency"): vol.Coerce(float),
+        vol.Optional("player_list"): [str],
+        vol.Optional("modded"): bool,
+        vol.Optional("mod_count"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("mod_list"): [{vol.Required("id"): str, vol.Required("version"): str}],
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+PUSH_SCHEMA = vol.Schema(
+    {
+        vol.Required("servers"): vol.All(
+            [SERVER_PUSH_SCHEMA], vol.Length(min=1, max=MAX_BATCH_SIZE)
+        ),
+    }
+)
+
+
+def _coordinators_by_address(
+    hass: HomeAssistant,
+) -> dict[tuple[str, int], McServerStatsCoordinator]:
+    """Map (host, port) to the running coordinator for that server."""
+    return {
+        (coordinator.host, coordinator.port): coordinator
+        for coordinators in hass.data.get(DOMAIN, {}).values()
+        for coordinator in coordinators.values()
+    }
+
+
+class McServerPushView(HomeAssistantView):
+    """Accept batched status reports from server-side plugins.
+
+    Requests must be authenticated with a long-lived access token. Fields
+    missing from a report keep their last known value.
+    """
+
+    url = PUSH_API_PATH
+    name = f"api:{DOMAIN}:push"
+    requires_auth = True
+
+    async def post(self, request: web.Request) -> web.Response:
+        """Apply a batch of pushed server statuses."""
+        hass: HomeAssistant = request.app[KEY_HASS]
+
+        try:
+            payload = PUSH_SCHEMA(await request.json())
+        except ValueError:
+            return self.json_message("Invalid JSON", HTTPStatus.BAD_REQUEST)
+        except vol.Invalid as err:
+            return self.json_message(
+                f"Invalid payload: {err}", HTTPStatus.BAD_REQUEST
+            )
+
+        coordinators = _coordinators_by_address(hass)
+        updated = 0
+        unknown: list[str] = []
+
+        for report in payload["servers"]:
+            host = report.pop("host")
+            port = report.pop("port")
+            coordinator = coordinators.get((host, port))
+            if coordinator is None:
+                unknown.append(f"{host}:{port}")
+                continue
+
+            if not report["online"]:
+                # Match what a failed poll reports for a stopped server
+                coordinator.async_handle_push(McServerData(online=False))
+                updated += 1
+                continue
+
+            if "mod_list" in report and "mod_count" not in report:
+                report["mod_count"] = len(report["mod_list"])
+                report.setdefault("modded", bool(report["mod_list"]))
+
+            current = coordinator.data or McServerData()
+            coordinator.async_handle_push(dataclasses.replace(current, **report))
+            updated += 1
+
+        if unknown:
+            _LOGGER.debug("Ignoring pushed status for unknown servers: %s", unknown)
+
+        return self.json({"updated": updated, "unknown": unknown})
@@ -0,0 +1,268 @@
+"""Minimal asyncio RCON client with a per-server connection pool."""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import re
+import struct
+import time
+from dataclasses import dataclass
+
+from .const import HAPPY_EYEBALLS_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+PACKET_TYPE_RESPONSE = 0
+PACKET_TYPE_COMMAND = 2
+PACKET_TYPE_LOGIN = 3
+
+# Vanilla splits responses every 4096 characters, not bytes, and a character
+# takes up to three bytes in UTF-8 (e.g. the § of colour codes takes two)
+MAX_FRAGMENT_CHARS = 4096
+MAX_PACKET_SIZE = 3 * MAX_FRAGMENT_CHARS + 10
+BACKOFF_MIN = 5  # seconds
+BACKOFF_MAX = 300  # seconds
+
+_HEADER = struct.Struct("<iii")
+
+TPS_PATTERNS = (
+    re.compile(r"TPS from last[^:]*:\s*\*?([\d.]+)"),  # Spigot / Paper
+    re.compile(r"Overall:\s*([\d.]+)\s*TPS"),  # Forge / NeoForge 1.18+
+    re.compile(r"Overall:.*?Mean TPS:\s*([\d.]+)", re.S),  # Forge (legacy)
+    re.compile(r"TPS:\s*\*?([\d.]+)"),
+)
+MSPT_PATTERNS = (
+    re.compile(r"tick times[^:]*:\s*\S*\s*([\d.]+)/"),  # Paper
+    re.compile(r"Overall:[^\n]*?\(([\d.]+)\s*ms/tick\)"),  # Forge / NeoForge 1.18+
+    re.compile(r"Overall:.*?Mean tick time:\s*([\d.]+)\s*ms", re.S),  # Forge (legacy)
+    re.compile(r"MSPT:\s*([\d.]+)", re.I),
+)
+CHUNK_PATTERNS = (
+    re.compile(r"(\d+)\s+(?:loaded\s+)?chunks", re.I),
+    re.compile(r"chunks[^:\d\n]*:\s*(\d+)", re.I),
+)
+
+
+class RconError(Exception):
+    """Raised when an RCON request fails."""
+
+
+class RconAuthError(RconError):
+    """Raised when the server rejects the RCON password."""
+
+
+@dataclass
+class McRconData:
+    """Dataclass holding the performance metrics read over RCON."""
+
+    tps: float | None = None
+    mspt: float | None = None
+    loaded_chunks: int | None = None
+
+
+def _first_match(patterns: tuple[re.Pattern[str], ...], text: str) -> str | None:
+    """Return the first capture group of the first pattern that matches."""
+    for pattern in patterns:
+        if match := pattern.search(text):
+            return match.group(1)
+    return None
+
+
+def parse_rcon_metrics(responses: list[str]) -> McRconData:
+    """Extract TPS, MSPT and loaded chunks from raw command responses."""
+    text = re.sub(r"§.", "", "\n".join(responses))
+
+    tps = _first_match(TPS_PATTERNS, text)
+    mspt = _first_match(MSPT_PATTERNS, text)
+    chunks = _first_match(CHUNK_PATTERNS, text)
+
+    return McRconData(
+        tps=round(float(tps), 2) if tps else None,
+        mspt=round(float(mspt), 2) if mspt else None,
+        loaded_chunks=int(chunks) if chunks else None,
+    )
+
+
+class RconConnection:
+    """A single authenticated RCON connection.
+
+    Commands of a batch are written in one go, followed by a sentinel request,
+    and their responses are matched back by request id until the sentinel is
+    answered, so a batch costs a single round trip.
+    """
+
+    def __init__(self, host: str, port: int, password: str) -> None:
+        """Initialize the connection."""
+        self.host = host
+        self.port = port
+        self._password = password
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._ids = itertools.cycle(range(1, 0x7FFFFFFF))
+        self._lock = asyncio.Lock()
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the connection is open."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    def _next_id(self) -> int:
+        return next(self._ids)
+
+    def _write_packet(self, request_id: int, packet_type: int, payload: str) -> None:
+        body = payload.encode("utf-8") + b"\x00\x00"
+        assert self._writer is not None
+        self._writer.write(
+            _HEADER.pack(len(body) + 8, request_id, packet_type) + body
+        )
+
+    async def _read_packet(self) -> tuple[int, int, str]:
+        assert self._reader is not None
+        (length,) = struct.unpack("<i", await self._reader.readexactly(4))
+        if not 10 <= length <= MAX_PACKET_SIZE:
+            raise RconError(f"Invalid RCON packet length {length}")
+        data = await self._reader.readexactly(length)
+        request_id, packet_type = struct.unpack_from("<ii", data)
+        return request_id, packet_type, data[8:-2].decode("utf-8", "replace")
+
+    async def async_connect(self, timeout: float) -> None:
+        """Open the socket and authenticate."""
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                self.host, self.port, happy_eyeballs_delay=HAPPY_EYEBALLS_DELAY
+            ),
+            timeout,
+        )
+        login_id = self._next_id()
+        self._write_packet(login_id, PACKET_TYPE_LOGIN, self._password)
+        await self._writer.drain()
+
+        while True:
+            request_id, packet_type, _ = await asyncio.wait_for(
+                self._read_packet(), timeout
+            )
+            if request_id == -1:
+                await self.async_close()
+                raise RconAuthError(
+                    f"RCON authentication failed for {self.host}:{self.port}"
+                )
+            if request_id == login_id and packet_type == PACKET_TYPE_COMMAND:
+                return
+
+    async def async_run_batch(self, commands: list[str], timeout: float) -> list[str]:
+        """Run a batch of commands pipelined and return their responses in order."""
+        if not self.connected:
+            raise RconError("RCON connection is closed")
+
+        async with self._lock:
+            ids = [self._next_id() for _ in commands]
+            for request_id, command in zip(ids, commands):
+                self._write_packet(request_id, PACKET_TYPE_COMMAND, command)
+            # Responses longer than one packet arrive as several fragments with
+            # the same id and nothing marks the last one. The server answers
+            # requests in order, so the reply to a trailing empty request of
+            # another type (vanilla answers "Unknown request") ends the batch.
+            sentinel_id = self._next_id()
+            self._write_packet(sentinel_id, PACKET_TYPE_RESPONSE, "")
+            await self._writer.drain()
+
+            # Anything not belonging to this batch is dropped
+            fragments: dict[int, list[str]] = {request_id: [] for request_id in ids}
+
+            async def _collect() -> None:
+                while True:
+                    request_id, packet_type, payload = await self._read_packet()
+                    if request_id == sentinel_id:
+                        return
+                    if packet_type != PACKET_TYPE_RESPONSE or request_id not in fragments:
+                        continue
+                    fragments[request_id].append(payload)
+
+            await asyncio.wait_for(_collect(), timeout)
+
+        return ["".join(fragments[request_id]) for request_id in ids]
+
+    async def async_close(self) -> None:
+        """Close the socket."""
+        if self._writer is None:
+            return
+        writer, self._writer, self._reader = self._writer, None, None
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (OSError, ConnectionError):
+            pass
+
+
+class RconPool:
+    """Keeps one authenticated connection per server and reconnects with backoff."""
+
+    def __init__(self) -> None:
+        """Initialize the pool."""
+        self._connections: dict[tuple[str, int], RconConnection] = {}
+        self._failures: dict[tuple[str, int], int] = {}
+        self._retry_at: dict[tuple[str, int], float] = {}
+
+    async def _async_get(
+        self, host: str, port: int, password: str, timeout: float
+    ) -> RconConnection:
+        key = (host, port)
+        connection = self._connections.get(key)
+        if connection is not None and connection.connected:
+            return connection
+
+        retry_at = self._retry_at.get(key, 0.0)
+        if time.monotonic() < retry_at:
+            raise RconError(
+                f"RCON for {host}:{port} backing off for "
+                f"{retry_at - time.monotonic():.0f}s"
+            )
+
+        connection = RconConnection(host, port, password)
+        try:
+            await connection.async_connect(timeout)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, RconError) as err:
+            await connection.async_close()
+            failures = self._failures.get(key, 0) + 1
+            self._failures[key] = failures
+            self._retry_at[key] = time.monotonic() + min(
+                BACKOFF_MIN * 2 ** (failures - 1), BACKOFF_MAX
+            )
+            if isinstance(err, RconError):
+                raise
+            raise RconError(f"Cannot connect to RCON on {host}:{port}: {err}") from err
+
+        self._failures.pop(key, None)
+        self._retry_at.pop(key, None)
+        self._connections[key] = connection
+        return connection
+
+    async def async_run_batch(
+        self,
+        host: str,
+        port: int,
+        password: str,
+        commands: list[str],
+        timeout: float = 5.0,
+    ) -> list[str]:
+        """Run a batch of commands on a server, connecting if necessary."""
+        connection = await self._async_get(host, port, password, timeout)
+        try:
+            return await connection.async_run_batch(commands, timeout)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, RconError) as err:
+            # Drop the broken connection, the next tick reconnects
+            await self.async_release(host, port)
+            raise RconError(f"RCON batch failed on {host}:{port}: {err}") from err
+
+    async def async_release(self, host: str, port: int) -> None:
+        """Close and forget the connection to a server, including its backoff.
+
+        Called when the entry unloads, so a reload (e.g. with a corrected
+        password) connects right away.
+        """
+        self._failures.pop((host, port), None)
+        self._retry_at.pop((host, port), None)
+        connection = self._connections.pop((host, port), None)
+        if connection is not None:
+            await connection.async_close()
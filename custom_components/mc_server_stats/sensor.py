@@ -4,13 +4,23 @@ from __future__ import annotations
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_HOST, CONF_PORT, CONF_SERVER_NAME, DOMAIN
-from .coordinator import McServerData, McServerStatsCoordinator
+from .const import (
+    CONF_ENTITY_PROFILE,
+    CONF_HOST,
+    CONF_SERVER_NAME,
+    DEFAULT_ENTITY_PROFILE,
+    DOMAIN,
+    ENTITY_PROFILE_LEAN,
+    RCON_KEY,
+)
+from .coordinator import McRconCoordinator, McServerData, McServerStatsCoordinator
+from .rcon import McRconData
 
 
 async def async_setup_entry(
@@ -18,23 +28,86 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up Minecraft Server Stats sensor entities."""
-    coordinator: McServerStatsCoordinator = hass.data[DOMAIN][entry.entry_id]
+    """Set up Minecraft Server Stats sensor entities for all servers of a host."""
+    coordinators: dict[str, McServerStatsCoordinator] = hass.data[DOMAIN][entry.entry_id]
+    rcon_coordinators: dict[str, McRconCoordinator] = hass.data[RCON_KEY][entry.entry_id]
     host = entry.data[CONF_HOST]
-    port = entry.data[CONF_PORT]
-    custom_name = entry.data.get(CONF_SERVER_NAME)
-
-    async_add_entities(
-        [
-            McServerPlayersSensor(coordinator, host, port, custom_name),
-            McServerMotdSensor(coordinator, host, port, custom_name),
-            McServerVersionSensor(coordinator, host, port, custom_name),
-            McServerLatencySensor(coordinator, host, port, custom_name),
-            McServerModsSensor(coordinator, host, port, custom_name),
-        ],
-        update_before_add=True,
+    lean = (
+        entry.options.get(
+            CONF_ENTITY_PROFILE,
+            entry.data.get(CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE),
+        )
+        == ENTITY_PROFILE_LEAN
     )
 
+    for subentry_id, coordinator in coordinators.items():
+        port = coordinator.port
+        custom_name = entry.subentries[subentry_id].data.get(CONF_SERVER_NAME)
+        _async_apply_entity_profile(hass, host, port, lean)
+
+        entities: list[SensorEntity]
+        if lean:
+            entities = [
+                McServerSummarySensor(coordinator, host, port, custom_name),
+                McServerLatencySensor(
+                    coordinator, host, port, custom_name, enabled_default=False
+                ),
+            ]
+        else:
+            entities = [
+                McServerPlayersSensor(coordinator, host, port, custom_name),
+                McServerMotdSensor(coordinator, host, port, custom_name),
+                McServerVersionSensor(coordinator, host, port, custom_name),
+                McServerLatencySensor(coordinator, host, port, custom_name),
+                McServerModsSensor(coordinator, host, port, custom_name),
+            ]
+
+        if (rcon_coordinator := rcon_coordinators.get(subentry_id)) is not None:
+            entities += [
+                McServerTpsSensor(rcon_coordinator, host, port, custom_name),
+                McServerMsptSensor(rcon_coordinator, host, port, custom_name),
+                McServerLoadedChunksSensor(rcon_coordinator, host, port, custom_name),
+            ]
+
+        async_add_entities(
+            entities, update_before_add=True, config_subentry_id=subentry_id
+        )
+
+
+# Sensors whose values the lean profile folds into the players sensor
+FOLDED_SENSOR_TYPES = ("motd", "version", "mods")
+
+
+@callback
+def _async_apply_entity_profile(
+    hass: HomeAssistant, host: str, port: int, lean: bool
+) -> None:
+    """Bring the registry entries of a server in line with the entity profile.
+
+    The lean profile drops the folded detail sensors and disables latency
+    (it changes on every poll). Switching back to the full profile enables
+    latency again unless the user disabled it.
+    """
+    ent_reg = er.async_get(hass)
+    if lean:
+        for sensor_type in FOLDED_SENSOR_TYPES:
+            if entity_id := ent_reg.async_get_entity_id(
+                "sensor", DOMAIN, f"{host}_{port}_{sensor_type}"
+            ):
+                ent_reg.async_remove(entity_id)
+
+    if not (
+        entity_id := ent_reg.async_get_entity_id("sensor", DOMAIN, f"{host}_{port}_latency")
+    ):
+        return
+    disabled_by = ent_reg.async_get(entity_id).disabled_by
+    if lean and disabled_by is None:
+        ent_reg.async_update_entity(
+            entity_id, disabled_by=er.RegistryEntryDisabler.INTEGRATION
+        )
+    elif not lean and disabled_by is er.RegistryEntryDisabler.INTEGRATION:
+        ent_reg.async_update_entity(entity_id, disabled_by=None)
+
 
 class McServerSensorBase(CoordinatorEntity[McServerStatsCoordinator], SensorEntity):
     """Base class for Minecraft server sensor entities."""
@@ -94,6 +167,25 @@ class McServerPlayersSensor(McServerSensorBase):
         }
 
 
+class McServerSummarySensor(McServerPlayersSensor):
+    """Players sensor of the lean profile, carrying MOTD, version and mods too."""
+
+    # The mod list can be long and only matters for the current state
+    _unrecorded_attributes = frozenset({"mod_list"})
+
+    @property
+    def extra_state_attributes(self):
+        data = self._server_data
+        return {
+            **super().extra_state_attributes,
+            "motd": data.motd or None,
+            "version": data.version or None,
+            "modded": data.modded,
+            "mod_count": data.mod_count,
+            "mod_list": data.mod_list,
+        }
+
+
 class McServerMotdSensor(McServerSensorBase):
     """Sensor for the server MOTD."""
 
@@ -127,8 +219,9 @@ class McServerLatencySensor(McServerSensorBase):
     _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def __init__(self, coordinator, host, port, custom_name=None):
+    def __init__(self, coordinator, host, port, custom_name=None, enabled_default=True):
         super().__init__(coordinator, host, port, "latency", "Latency", custom_name)
+        self._attr_entity_registry_enabled_default = enabled_default
 
     @property
     def native_value(self):
@@ -158,3 +251,79 @@ class McServerModsSensor(McServerSensorBase):
         }
 
 
+class McRconSensorBase(CoordinatorEntity[McRconCoordinator], SensorEntity):
+    """Base class for sensors fed by the RCON collector."""
+
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: McRconCoordinator,
+        host: str,
+        port: int,
+        sensor_type: str,
+        name_suffix: str,
+        custom_name: str | None = None,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._host = host
+        self._port = port
+        self._sensor_type = sensor_type
+
+        self._attr_unique_id = f"{host}_{port}_{sensor_type}"
+        self._attr_name = name_suffix
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{host}:{port}")},
+            name=custom_name or f"Minecraft Server {host}:{port}",
+            manufacturer="Mojang",
+            model="Minecraft Java Server",
+        )
+
+    @property
+    def _rcon_data(self) -> McRconData:
+        """Return the RCON metrics, or a default if unavailable."""
+        if self.coordinator.data:
+            return self.coordinator.data
+        return McRconData()
+
+
+class McServerTpsSensor(McRconSensorBase):
+    """Sensor for the server ticks per second."""
+
+    _attr_icon = "mdi:speedometer"
+
+    def __init__(self, coordinator, host, port, custom_name=None):
+        super().__init__(coordinator, host, port, "tps", "TPS", custom_name)
+
+    @property
+    def native_value(self):
+        return self._rcon_data.tps
+
+
+class McServerMsptSensor(McRconSensorBase):
+    """Sensor for the average milliseconds per tick."""
+
+    _attr_icon = "mdi:timer-sand"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def __init__(self, coordinator, host, port, custom_name=None):
+        super().__init__(coordinator, host, port, "mspt", "MSPT", custom_name)
+
+    @property
+    def native_value(self):
+        return self._rcon_data.mspt
+
+
+class McServerLoadedChunksSensor(McRconSensorBase):
+    """Sensor for the number of loaded chunks."""
+
+    _attr_icon = "mdi:grid"
+
+    def __init__(self, coordinator, host, port, custom_name=None):
+        super().__init__(coordinator, host, port, "loaded_chunks", "Loaded chunks", custom_name)
+
+    @property
+    def native_value(self):
+        return self._rcon_data.loaded_chunks
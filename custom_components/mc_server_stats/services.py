@@ -0,0 +1,133 @@
+"""Services of the Minecraft Server Stats integration."""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+
+from .const import (
+    ATTR_DURATION,
+    ATTR_ONLINE_ONLY,
+    ATTR_REFRESH,
+    CONF_HOST,
+    CONF_PORT,
+    CONF_SERVER_NAME,
+    DEFAULT_PROFILE_DURATION,
+    DOMAIN,
+    MAX_PARALLEL_REFRESHES,
+    MAX_PROFILE_DURATION,
+    RCON_KEY,
+    SERVICE_GET_STATUS,
+    SERVICE_PROFILE,
+)
+from .coordinator import McRconCoordinator, McServerStatsCoordinator
+from .profiling import async_profile
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=5, max=MAX_PROFILE_DURATION)
+        ),
+    }
+)
+
+GET_STATUS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_HOST): str,
+        vol.Optional(CONF_PORT): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
+        vol.Optional(ATTR_ONLINE_ONLY, default=False): bool,
+        vol.Optional(ATTR_REFRESH, default=False): bool,
+    }
+)
+
+
+def _selected_servers(
+    hass: HomeAssistant, host: str | None, port: int | None
+) -> list[tuple[str, McServerStatsCoordinator, McRconCoordinator | None]]:
+    """Return name, coordinator and RCON coordinator of the matching servers."""
+    servers = []
+    for entry_id, coordinators in hass.data.get(DOMAIN, {}).items():
+        entry = hass.config_entries.async_get_entry(entry_id)
+        rcon_coordinators = hass.data.get(RCON_KEY, {}).get(entry_id, {})
+        for subentry_id, coordinator in coordinators.items():
+            if host is not None and coordinator.host != host:
+                continue
+            if port is not None and coordinator.port != port:
+                continue
+            subentry = entry.subentries.get(subentry_id) if entry else None
+            name = (
+                subentry.data.get(CONF_SERVER_NAME) or subentry.title
+                if subentry
+                else f"{coordinator.host}:{coordinator.port}"
+            )
+            servers.append((name, coordinator, rcon_coordinators.get(subentry_id)))
+    return servers
+
+
+async def _async_refresh(
+    servers: list[tuple[str, McServerStatsCoordinator, McRconCoordinator | None]],
+) -> None:
+    """Refresh the servers concurrently, at most MAX_PARALLEL_REFRESHES at once."""
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_REFRESHES)
+
+    async def _refresh(
+        coordinator: McServerStatsCoordinator, rcon: McRconCoordinator | None
+    ) -> None:
+        async with semaphore:
+            await coordinator.async_refresh()
+            if rcon is not None:
+                await rcon.async_refresh()
+
+    await asyncio.gather(*(_refresh(c, rcon) for _, c, rcon in servers))
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def _async_profile(call: ServiceCall) -> None:
+        await async_profile(hass, call.data[ATTR_DURATION])
+
+    async def _async_get_status(call: ServiceCall) -> ServiceResponse:
+        servers = _selected_servers(
+            hass, call.data.get(CONF_HOST), call.data.get(CONF_PORT)
+        )
+        if call.data[ATTR_REFRESH]:
+            await _async_refresh(servers)
+
+        result: list[dict[str, Any]] = []
+        for name, coordinator, rcon in servers:
+            data = coordinator.data
+            if call.data[ATTR_ONLINE_ONLY] and not (data and data.online):
+                continue
+            status: dict[str, Any] = {
+                "name": name,
+                CONF_HOST: coordinator.host,
+                CONF_PORT: coordinator.port,
+                **(dataclasses.asdict(data) if data else {"online": False}),
+            }
+            if rcon is not None:
+                status["rcon"] = dataclasses.asdict(rcon.data) if rcon.data else None
+            result.append(status)
+        return {"servers": result}
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_profile, schema=PROFILE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_STATUS,
+        _async_get_status,
+        schema=GET_STATUS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
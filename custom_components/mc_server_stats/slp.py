@@ -0,0 +1,133 @@
+"""Server List Ping status requests that keep the hostname in the handshake.
+
+mcstatus writes the address it connects to into the handshake, so
+connecting to a resolved IP would hide the hostname from proxies with
+forced hosts (Velocity, BungeeCord) and from virtual-host routing. This
+client connects to the name itself, letting asyncio race IPv6 and IPv4
+(RFC 8305), and only leaves parsing the response to mcstatus.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+import time
+
+from .const import HAPPY_EYEBALLS_DELAY
+
+try:
+    from mcstatus.responses import JavaStatusResponse
+except ImportError:  # mcstatus < 12
+    from mcstatus.status_response import JavaStatusResponse
+
+PROTOCOL_VERSION = 47  # same as mcstatus, every server answers status for it
+MAX_RESPONSE = 2 * 1024 * 1024  # bytes, real status responses are far smaller
+
+
+def _encode_varint(value: int) -> bytes:
+    value &= 0xFFFFFFFF
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _decode_varint(data: bytes, offset: int) -> tuple[int, int]:
+    """Return a VarInt from data and the offset after it."""
+    result = 0
+    for shift in range(0, 35, 7):
+        if offset >= len(data):
+            raise OSError("Truncated status response")
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, offset
+    raise OSError("VarInt too long in status response")
+
+
+async def _read_varint(reader: asyncio.StreamReader) -> int:
+    result = 0
+    for shift in range(0, 35, 7):
+        byte = (await reader.readexactly(1))[0]
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result
+    raise OSError("VarInt too long in status response")
+
+
+def _packet(packet_id: int, payload: bytes = b"") -> bytes:
+    body = _encode_varint(packet_id) + payload
+    return _encode_varint(len(body)) + body
+
+
+def _handshake(host: str, port: int) -> bytes:
+    name = host.encode("utf-8")
+    return _packet(
+        0x00,
+        _encode_varint(PROTOCOL_VERSION)
+        + _encode_varint(len(name))
+        + name
+        + port.to_bytes(2, "big")
+        + _encode_varint(1),  # next state: status
+    )
+
+
+async def _async_connect(
+    host: str, port: int, family: int
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Connect to a host, racing its address families."""
+    try:
+        return await asyncio.open_connection(
+            host,
+            port,
+            family=family,
+            happy_eyeballs_delay=HAPPY_EYEBALLS_DELAY,
+            all_errors=True,
+        )
+    except ExceptionGroup as group:
+        # Refused on every address means the host is up but nothing listens,
+        # any other error (unreachable, reset) is the more telling one
+        refused, other = group.split(ConnectionRefusedError)
+        raise (other or refused).exceptions[0] from None
+
+
+async def async_java_status(
+    host: str,
+    port: int,
+    timeout: float,
+    family: int = socket.AF_UNSPEC,
+) -> tuple[JavaStatusResponse, int]:
+    """Return the status of a Java server and the address family that answered.
+
+    ``timeout`` is one deadline for resolving, connecting and the exchange.
+    """
+    async with asyncio.timeout(timeout):
+        reader, writer = await _async_connect(host, port, family)
+        try:
+            connected_family = writer.get_extra_info("socket").family
+            writer.write(_handshake(host, port) + _packet(0x00))
+            started = time.perf_counter()
+            await writer.drain()
+            length = await _read_varint(reader)
+            if length > MAX_RESPONSE:
+                raise OSError("Status response too large")
+            data = await reader.readexactly(length)
+            latency = (time.perf_counter() - started) * 1000
+        finally:
+            writer.close()
+
+    packet_id, offset = _decode_varint(data, 0)
+    if packet_id != 0x00:
+        raise OSError("Received invalid status response packet")
+    size, offset = _decode_varint(data, offset)
+    try:
+        raw = json.loads(data[offset : offset + size].decode("utf-8"))
+        return JavaStatusResponse.build(raw, latency=latency), connected_family
+    except (UnicodeDecodeError, ValueError, TypeError, KeyError) as err:
+        raise OSError(f"Received invalid status response: {err}") from err
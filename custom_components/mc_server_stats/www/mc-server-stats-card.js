@@ -74,10 +74,11 @@ class McServerStatsCard extends HTMLElement {
     }
 
     const sensorsByFriendlyName = {};
+    const imagesByFriendlyName = {};
     for (const [entityId, stateObj] of Object.entries(this._hass.states)) {
-      if (!entityId.startsWith("sensor.")) continue;
       const fname = (stateObj.attributes || {}).friendly_name || "";
-      sensorsByFriendlyName[fname] = entityId;
+      if (entityId.startsWith("sensor.")) sensorsByFriendlyName[fname] = entityId;
+      else if (entityId.startsWith("image.")) imagesByFriendlyName[fname] = entityId;
     }
 
     for (const { entityId, deviceName } of statusEntities) {
@@ -92,6 +93,7 @@ class McServerStatsCard extends HTMLElement {
         version_entity: sensorsByFriendlyName[`${deviceName} Version`] || null,
         latency_entity: sensorsByFriendlyName[`${deviceName} Latency`] || null,
         mods_entity: sensorsByFriendlyName[`${deviceName} Mods`] || null,
+        favicon_entity: imagesByFriendlyName[`${deviceName} Favicon`] || null,
       });
     }
 
@@ -157,6 +159,9 @@ class McServerStatsCard extends HTMLElement {
         font-size: 22px; font-weight: 700; margin-bottom: 4px;
         display: flex; align-items: center; gap: 10px;
       }
+      .favicon {
+        width: 32px; height: 32px; border-radius: 4px; image-rendering: pixelated;
+      }
       .online-badge {
         display: inline-block; padding: 2px 10px; border-radius: 12px;
         font-size: 11px; font-weight: 600; background: #4CAF50; color: #fff;
@@ -302,17 +307,23 @@ class McServerStatsCard extends HTMLElement {
     const versionEntity = server.version_entity ? hass.states[server.version_entity] : null;
     const latencyEntity = server.latency_entity ? hass.states[server.latency_entity] : null;
     const modsEntity = server.mods_entity ? hass.states[server.mods_entity] : null;
+    const faviconEntity = server.favicon_entity ? hass.states[server.favicon_entity] : null;
 
     const isOnline = statusEntity && statusEntity.state === "on";
     const playerCount = playersEntity ? parseInt(playersEntity.state, 10) || 0 : 0;
     const maxPlayers = playersEntity?.attributes?.max_players ?? "?";
     const playerNames = playersEntity?.attributes?.player_names ?? [];
-    const motd = motdEntity?.state ?? "";
-    const version = versionEntity?.state ?? "?";
+    // The lean entity profile folds MOTD, version and mods into the players sensor
+    const playerAttrs = playersEntity?.attributes ?? {};
+    const motd = motdEntity?.state ?? playerAttrs.motd ?? "";
+    const version = versionEntity?.state ?? playerAttrs.version ?? "?";
     const latency = latencyEntity ? parseFloat(latencyEntity.state) || 0 : 0;
     const serverName = server.name || "Minecraft Server";
-    const modded = modsEntity?.attributes?.modded ?? false;
-    const modCount = modsEntity?.attributes?.mod_count ?? 0;
+    const modsAttrs = modsEntity?.attributes ?? playerAttrs;
+    const modded = modsAttrs.modded ?? false;
+    const modCount = modsAttrs.mod_count ?? 0;
+    // Content-hashed URL, only changes (and is re-downloaded) when the icon does
+    const faviconUrl = faviconEntity?.attributes?.entity_picture ?? null;
 
     let dotsHtml = "";
     if (displayServers.length > 1) {
@@ -325,7 +336,7 @@ class McServerStatsCard extends HTMLElement {
       ? `<span class="online-badge">ONLINE</span>`
       : `<span class="offline-badge">OFFLINE</span>`;
 
-    const modsBadge = modsEntity
+    const modsBadge = modsEntity || "modded" in playerAttrs
       ? modded
         ? `<span class="mods-badge">🧩 ${modCount} Mods</span>`
         : `<span class="mods-badge vanilla">🟢 Vanilla</span>`
@@ -347,6 +358,7 @@ class McServerStatsCard extends HTMLElement {
       <div class="server-view">
         ${this._renderHeader(dotsHtml)}
         <div class="server-name">
+          ${faviconUrl ? `<img class="favicon" src="${faviconUrl}" alt="" />` : ""}
           ${serverName}
           ${statusBadge}
         </div>